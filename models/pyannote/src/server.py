@@ -1,10 +1,12 @@
 """FastAPI server for pyannote speaker diarization with async processing."""
 
 import asyncio
+import base64
+import multiprocessing
 import os
 import tempfile
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
@@ -12,7 +14,9 @@ from typing import Optional
 import numpy as np
 import soundfile as sf
 import torch
+import torchaudio
 from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from pyannote.audio import Pipeline
 
@@ -20,13 +24,77 @@ app = FastAPI(
     title="Pyannote Speaker Diarization API",
     description="Speaker diarization and embeddings using pyannote-audio",
     version="2.0.0",
+    # orjson encodes the large float-heavy responses (segments,
+    # embeddings) in C instead of Python-level iteration
+    default_response_class=ORJSONResponse,
 )
 
-# Global pipeline instance
+# Per-process pipeline instance. In the API process this stays None;
+# each diarization worker process loads its own copy in _init_worker.
 pipeline: Optional[Pipeline] = None
 
-# Thread pool for CPU-bound diarization work
-executor = ThreadPoolExecutor(max_workers=2)
+# Set once the worker pool has loaded the model
+model_loaded = False
+
+
+def _load_pipeline() -> Pipeline:
+    """Load the pyannote pipeline from MODEL_PATH or HuggingFace."""
+    model_path = os.getenv("MODEL_PATH", "/mnt/models")
+    hf_token = os.getenv("HF_TOKEN")
+    model_name = os.getenv("MODEL_NAME", "pyannote/speaker-diarization-3.1")
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    if os.path.exists(os.path.join(model_path, "config.yaml")):
+        loaded = Pipeline.from_pretrained(model_path)
+    else:
+        if not hf_token:
+            raise ValueError(
+                "HF_TOKEN required to download model from HuggingFace. "
+                "Either provide HF_TOKEN or mount model at MODEL_PATH."
+            )
+        loaded = Pipeline.from_pretrained(model_name, token=hf_token)
+
+    loaded = loaded.to(torch.device(device))
+    print(f"Model loaded successfully on {device}")
+    return loaded
+
+
+def _init_worker(slot_counter, device_ids: list[int]):
+    """Initialize a diarization worker: pin a CUDA device, load the pipeline."""
+    global pipeline
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+    if device_ids:
+        torch.cuda.set_device(device_ids[slot % len(device_ids)])
+    pipeline = _load_pipeline()
+
+
+def _worker_ready() -> bool:
+    """Probe run inside a worker process to confirm its pipeline loaded."""
+    return pipeline is not None
+
+
+# Diarization runs in worker processes so PyTorch inference never
+# competes with the event loop (or other requests) for the GIL. One
+# worker per CUDA device by default; two workers on CPU-only boxes.
+_device_ids = list(range(torch.cuda.device_count())) if torch.cuda.is_available() else []
+_default_workers = max(2, len(_device_ids)) if not _device_ids else len(_device_ids)
+DIARIZATION_WORKERS = int(os.getenv("DIARIZATION_WORKERS", str(_default_workers)))
+
+_mp_context = multiprocessing.get_context("spawn")
+_worker_slot = _mp_context.Value("i", 0)
+executor = ProcessPoolExecutor(
+    max_workers=DIARIZATION_WORKERS,
+    mp_context=_mp_context,
+    initializer=_init_worker,
+    initargs=(_worker_slot, _device_ids),
+)
+
+# Separate small thread pool for blocking I/O (uploads, Milvus calls) so
+# it never queues behind diarization jobs.
+io_executor = ThreadPoolExecutor(max_workers=int(os.getenv("THREAD_POOL_SIZE", "8")))
 
 # In-memory job storage (for single pod - use Redis for multi-pod)
 jobs: dict = {}
@@ -80,6 +148,17 @@ class JobResultResponse(BaseModel):
     error: Optional[str] = None
 
 
+class BatchAddRequest(BaseModel):
+    """Batched speaker import: JSON lists or base64-packed float16 rows."""
+
+    embeddings: Optional[list[list[float]]] = None
+    embeddings_f16_b64: Optional[str] = None
+    speaker_ids: Optional[list[str]] = None
+    speaker_names: Optional[list[str]] = None
+    session_speakers: Optional[list[str]] = None
+    recording_id: Optional[str] = None
+
+
 class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
@@ -87,14 +166,92 @@ class HealthResponse(BaseModel):
     active_jobs: int
 
 
+TARGET_SAMPLE_RATE = 16000
+
+# Chunk size for spooling uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _spool_upload(file: UploadFile) -> str:
+    """Stream an upload to a temp file without buffering it in memory.
+
+    Returns the temp file path; the caller is responsible for cleanup.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            tmp.write(chunk)
+        return tmp.name
+
+
+def _parse_pcm16_header(file_path: str) -> Optional[tuple]:
+    """Locate the data chunk of a plain 16-bit PCM WAV file.
+
+    Returns (data_offset, n_channels, sample_rate, n_frames), or None
+    when the file is not uncompressed PCM16 (compressed/float formats go
+    through the soundfile decoder instead).
+    """
+    with open(file_path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id = header[:4]
+            size = int.from_bytes(header[4:8], "little")
+            if chunk_id == b"fmt ":
+                fmt = f.read(size + (size % 2))
+            elif chunk_id == b"data":
+                if fmt is None or len(fmt) < 16:
+                    return None
+                audio_format = int.from_bytes(fmt[0:2], "little")
+                n_channels = int.from_bytes(fmt[2:4], "little")
+                sample_rate = int.from_bytes(fmt[4:8], "little")
+                bits_per_sample = int.from_bytes(fmt[14:16], "little")
+                if audio_format != 1 or bits_per_sample != 16 or n_channels == 0:
+                    return None
+                return f.tell(), n_channels, sample_rate, size // (2 * n_channels)
+            else:
+                f.seek(size + (size % 2), 1)
+
+
 def load_audio(file_path: str) -> dict:
     """Load audio file and convert to pyannote format."""
-    waveform, sample_rate = sf.read(file_path, dtype="float32")
-    waveform = torch.from_numpy(waveform)
+    header = _parse_pcm16_header(file_path)
+    if header is not None:
+        # PCM16 fast path: map the samples directly instead of copying
+        # the whole file through libsndfile's decode buffers.
+        data_offset, n_channels, sample_rate, n_frames = header
+        pcm = np.memmap(
+            file_path,
+            dtype="<i2",
+            mode="r",
+            offset=data_offset,
+            shape=(n_frames, n_channels),
+        )
+        waveform = torch.from_numpy(pcm.astype(np.float32) / 32768.0)
+    else:
+        waveform, sample_rate = sf.read(file_path, dtype="float32")
+        waveform = torch.from_numpy(waveform)
     if waveform.ndim == 1:
         waveform = waveform.unsqueeze(0)
     else:
         waveform = waveform.T
+    if sample_rate != TARGET_SAMPLE_RATE:
+        # Resample on GPU when available: much faster for long recordings
+        # than letting pyannote resample on CPU per-request.
+        if torch.cuda.is_available():
+            waveform = waveform.to("cuda", non_blocking=True)
+        waveform = torchaudio.functional.resample(
+            waveform, sample_rate, TARGET_SAMPLE_RATE, lowpass_filter_width=6
+        )
+        sample_rate = TARGET_SAMPLE_RATE
+    if torch.cuda.is_available() and waveform.device.type == "cpu":
+        # Page-lock the buffer so the pipeline's H2D copy can use DMA and
+        # overlap with kernel execution instead of stalling synchronously.
+        waveform = waveform.pin_memory()
     return {"waveform": waveform, "sample_rate": sample_rate}
 
 
@@ -105,7 +262,7 @@ def run_diarization(
     max_speakers: Optional[int] = None,
     return_embeddings: bool = False,
 ) -> tuple:
-    """Run diarization synchronously (called from thread pool)."""
+    """Run diarization synchronously (called inside a worker process)."""
     params = {}
     if num_speakers is not None:
         params["num_speakers"] = num_speakers
@@ -114,19 +271,33 @@ def run_diarization(
     if max_speakers is not None:
         params["max_speakers"] = max_speakers
 
-    result = pipeline(audio, **params)
+    # inference_mode drops autograd bookkeeping; on CUDA, fp16 autocast
+    # moves the backbone GEMMs onto tensor cores.
+    with torch.inference_mode():
+        if torch.cuda.is_available():
+            # Run on a dedicated stream so work from concurrent executor
+            # workers can overlap instead of serializing on the default stream.
+            stream = torch.cuda.Stream()
+            with torch.cuda.stream(stream), torch.autocast(
+                device_type="cuda", dtype=torch.float16
+            ):
+                result = pipeline(audio, **params)
+            stream.synchronize()
+        else:
+            result = pipeline(audio, **params)
 
     # Extract annotation
     diarization = getattr(result, "speaker_diarization", result)
 
-    # Build segments
-    segments = []
-    speakers = set()
-    for turn, _, speaker in diarization.itertracks(yield_label=True):
-        segments.append(
-            DiarizationSegment(start=turn.start, end=turn.end, speaker=speaker)
-        )
-        speakers.add(speaker)
+    # Build segments. The values come straight from pyannote, so use
+    # model_construct to skip per-segment validation: long meetings
+    # produce thousands of turns.
+    tracks = list(diarization.itertracks(yield_label=True))
+    segments = [
+        DiarizationSegment.model_construct(start=turn.start, end=turn.end, speaker=speaker)
+        for turn, _, speaker in tracks
+    ]
+    speakers = {speaker for _, _, speaker in tracks}
 
     diarization_result = DiarizationResponse(
         segments=segments, num_speakers=len(speakers)
@@ -137,16 +308,28 @@ def run_diarization(
     if return_embeddings:
         speaker_embeddings = getattr(result, "speaker_embeddings", None)
         if speaker_embeddings is not None:
+            # Convert to a single CPU ndarray up front instead of doing a
+            # GPU->CPU->numpy->list round-trip per speaker. The explicit
+            # float() keeps the response fp32 even under fp16 autocast.
+            if isinstance(speaker_embeddings, torch.Tensor):
+                all_emb = speaker_embeddings.to("cpu", non_blocking=True).float().numpy()
+            elif isinstance(speaker_embeddings, np.ndarray):
+                all_emb = speaker_embeddings
+            else:
+                all_emb = np.stack(
+                    [
+                        e.cpu().float().numpy() if isinstance(e, torch.Tensor) else np.asarray(e)
+                        for e in speaker_embeddings
+                    ]
+                )
+
             embeddings = []
             speaker_list = sorted(speakers)
             for i, speaker in enumerate(speaker_list):
-                if i < len(speaker_embeddings):
-                    emb = speaker_embeddings[i]
-                    if isinstance(emb, np.ndarray):
-                        emb = emb.tolist()
-                    elif isinstance(emb, torch.Tensor):
-                        emb = emb.cpu().numpy().tolist()
-                    embeddings.append(SpeakerEmbedding(speaker=speaker, embedding=emb))
+                if i < len(all_emb):
+                    embeddings.append(
+                        SpeakerEmbedding(speaker=speaker, embedding=all_emb[i].tolist())
+                    )
             if embeddings:
                 embeddings_result = EmbeddingsResponse(
                     embeddings=embeddings, dimension=len(embeddings[0].embedding)
@@ -155,20 +338,35 @@ def run_diarization(
     return diarization_result, embeddings_result
 
 
+def diarize_file(
+    file_path: str,
+    num_speakers: Optional[int] = None,
+    min_speakers: Optional[int] = None,
+    max_speakers: Optional[int] = None,
+    return_embeddings: bool = False,
+) -> tuple:
+    """Load audio and diarize it inside a worker process.
+
+    Taking the file path (rather than a decoded waveform) keeps large
+    tensors out of the parent process and off the pickle path.
+    """
+    audio = load_audio(file_path)
+    return run_diarization(
+        audio, num_speakers, min_speakers, max_speakers, return_embeddings
+    )
+
+
 async def process_job(job_id: str, file_path: str, params: dict):
     """Process diarization job in background."""
     try:
         jobs[job_id]["status"] = JobStatus.PROCESSING
 
-        # Load audio
-        audio = load_audio(file_path)
-
-        # Run diarization in thread pool to not block event loop
+        # Run diarization in a worker process to not block the event loop
         loop = asyncio.get_event_loop()
         diarization_result, embeddings_result = await loop.run_in_executor(
             executor,
-            run_diarization,
-            audio,
+            diarize_file,
+            file_path,
             params.get("num_speakers"),
             params.get("min_speakers"),
             params.get("max_speakers"),
@@ -205,28 +403,18 @@ def cleanup_old_jobs():
 
 @app.on_event("startup")
 async def load_model():
-    """Load the pyannote pipeline on startup."""
-    global pipeline
-
-    model_path = os.getenv("MODEL_PATH", "/mnt/models")
-    hf_token = os.getenv("HF_TOKEN")
-    model_name = os.getenv("MODEL_NAME", "pyannote/speaker-diarization-3.1")
+    """Warm the diarization worker pool (each worker loads the pipeline)."""
+    global model_loaded
 
-    device = "cuda" if torch.cuda.is_available() else "cpu"
+    loop = asyncio.get_event_loop()
+    # Route default run_in_executor work (blocking I/O) to the thread
+    # pool so it never queues behind diarization jobs.
+    loop.set_default_executor(io_executor)
 
     try:
-        if os.path.exists(os.path.join(model_path, "config.yaml")):
-            pipeline = Pipeline.from_pretrained(model_path)
-        else:
-            if not hf_token:
-                raise ValueError(
-                    "HF_TOKEN required to download model from HuggingFace. "
-                    "Either provide HF_TOKEN or mount model at MODEL_PATH."
-                )
-            pipeline = Pipeline.from_pretrained(model_name, token=hf_token)
-
-        pipeline = pipeline.to(torch.device(device))
-        print(f"Model loaded successfully on {device}")
+        model_loaded = await loop.run_in_executor(executor, _worker_ready)
+        if not model_loaded:
+            raise RuntimeError("Diarization worker failed to load pipeline")
     except Exception as e:
         print(f"Failed to load model: {e}")
         raise
@@ -238,8 +426,8 @@ async def health():
     device = "cuda" if torch.cuda.is_available() else "cpu"
     active = sum(1 for j in jobs.values() if j["status"] in [JobStatus.PENDING, JobStatus.PROCESSING])
     return HealthResponse(
-        status="healthy" if pipeline is not None else "unhealthy",
-        model_loaded=pipeline is not None,
+        status="healthy" if model_loaded else "unhealthy",
+        model_loaded=model_loaded,
         device=device,
         active_jobs=active,
     )
@@ -248,7 +436,7 @@ async def health():
 @app.get("/ready")
 async def ready():
     """Readiness probe endpoint."""
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
     return {"status": "ready"}
 
@@ -270,19 +458,15 @@ async def diarize(
 
     For long audio files, consider using /v1/diarize/async instead.
     """
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         result, _ = await loop.run_in_executor(
-            executor, run_diarization, audio, num_speakers, min_speakers, max_speakers, False
+            executor, diarize_file, tmp_path, num_speakers, min_speakers, max_speakers, False
         )
         return result
     except Exception as e:
@@ -295,19 +479,15 @@ async def diarize(
 @app.post("/v1/vad")
 async def voice_activity_detection(file: UploadFile = File(...)):
     """Perform voice activity detection on an audio file."""
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         result, _ = await loop.run_in_executor(
-            executor, run_diarization, audio, None, None, None, False
+            executor, diarize_file, tmp_path, None, None, None, False
         )
         speech_segments = [{"start": s.start, "end": s.end} for s in result.segments]
         return {"speech_segments": speech_segments}
@@ -344,17 +524,14 @@ async def diarize_async(
         max_speakers: Maximum number of speakers (optional)
         return_embeddings: Also extract speaker embeddings (for Milvus storage)
     """
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
     # Clean up old jobs periodically
     cleanup_old_jobs()
 
     # Save file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     # Create job
     job_id = str(uuid.uuid4())
@@ -457,19 +634,15 @@ async def extract_embeddings(
 
     Embedding dimension: 512 (pyannote speaker embedding model)
     """
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         _, embeddings_result = await loop.run_in_executor(
-            executor, run_diarization, audio, num_speakers, min_speakers, max_speakers, True
+            executor, diarize_file, tmp_path, num_speakers, min_speakers, max_speakers, True
         )
 
         if embeddings_result is None:
@@ -501,19 +674,15 @@ async def diarize_with_embeddings(
 
     Returns both diarization segments and speaker embeddings.
     """
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         diarization_result, embeddings_result = await loop.run_in_executor(
-            executor, run_diarization, audio, num_speakers, min_speakers, max_speakers, True
+            executor, diarize_file, tmp_path, num_speakers, min_speakers, max_speakers, True
         )
 
         return {
@@ -591,19 +760,15 @@ async def identify_speakers(
             detail="Speaker tracking unavailable. Milvus not connected.",
         )
 
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         diarization_result, embeddings_result = await loop.run_in_executor(
-            executor, run_diarization, audio, num_speakers, min_speakers, max_speakers, True
+            executor, diarize_file, tmp_path, num_speakers, min_speakers, max_speakers, True
         )
 
         if embeddings_result is None:
@@ -612,34 +777,65 @@ async def identify_speakers(
                 detail="Failed to extract embeddings for speaker identification.",
             )
 
-        # Identify each speaker
+        # Search all detected speakers in one batched Milvus call, then
+        # only create entries for embeddings with no match. A single
+        # float32 matrix avoids per-float boxing in pymilvus, and each
+        # unique session label hits Milvus exactly once even when the
+        # pipeline emits several embeddings for it.
+        emb_matrix = np.asarray(
+            [emb.embedding for emb in embeddings_result.embeddings], dtype=np.float32
+        )
+        unique_rows: dict[str, int] = {}
+        for i, emb in enumerate(embeddings_result.embeddings):
+            unique_rows.setdefault(emb.speaker, i)
+        match_lists = tracker.find_speakers_batch(
+            emb_matrix[list(unique_rows.values())],
+            threshold=similarity_threshold,
+            limit=1,
+        )
         identified_speakers = []
-        for emb in embeddings_result.embeddings:
-            result = tracker.identify_or_create(
-                embedding=emb.embedding,
-                recording_id=recording_id,
-                session_speaker=emb.speaker,
-                threshold=similarity_threshold,
-            )
-            identified_speakers.append({
-                "session_speaker": emb.speaker,
-                "speaker_id": result["speaker_id"],
-                "speaker_name": result["speaker_name"],
-                "is_new": result["is_new"],
-                "similarity": result["similarity"],
-                "matched_recording": result["matched_recording"],
-            })
-
-        # Map session speakers to persistent IDs in segments
-        speaker_map = {s["session_speaker"]: s["speaker_id"] for s in identified_speakers}
-        segments_with_ids = []
-        for seg in diarization_result.segments:
-            segments_with_ids.append({
+        speaker_map = {}
+        for (session_speaker, row), matches in zip(unique_rows.items(), match_lists):
+            if matches:
+                best_match = matches[0]
+                speaker_id = best_match["speaker_id"]
+                identified_speakers.append({
+                    "session_speaker": session_speaker,
+                    "speaker_id": speaker_id,
+                    "speaker_name": best_match["speaker_name"],
+                    "is_new": False,
+                    "similarity": best_match["similarity"],
+                    "matched_recording": best_match["recording_id"],
+                })
+            else:
+                speaker_id = tracker.add_speaker(
+                    embedding=emb_matrix[row],
+                    recording_id=recording_id,
+                    session_speaker=session_speaker,
+                )
+                identified_speakers.append({
+                    "session_speaker": session_speaker,
+                    "speaker_id": speaker_id,
+                    "speaker_name": None,
+                    "is_new": True,
+                    "similarity": None,
+                    "matched_recording": None,
+                })
+            speaker_map[session_speaker] = speaker_id
+
+        # Map session speakers to persistent IDs in segments. Single
+        # comprehension with a pre-bound .get: recordings can have
+        # thousands of segments.
+        sm_get = speaker_map.get
+        segments_with_ids = [
+            {
                 "start": seg.start,
                 "end": seg.end,
                 "session_speaker": seg.speaker,
-                "speaker_id": speaker_map.get(seg.speaker, seg.speaker),
-            })
+                "speaker_id": sm_get(seg.speaker, seg.speaker),
+            }
+            for seg in diarization_result.segments
+        ]
 
         return {
             "recording_id": recording_id,
@@ -676,19 +872,15 @@ async def search_speaker(
             detail="Speaker tracking unavailable. Milvus not connected.",
         )
 
-    if pipeline is None:
+    if not model_loaded:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await _spool_upload(file)
 
     try:
-        audio = load_audio(tmp_path)
         loop = asyncio.get_event_loop()
         _, embeddings_result = await loop.run_in_executor(
-            executor, run_diarization, audio, None, None, None, True
+            executor, diarize_file, tmp_path, None, None, None, True
         )
 
         if embeddings_result is None or not embeddings_result.embeddings:
@@ -697,18 +889,19 @@ async def search_speaker(
                 detail="No speakers detected in audio.",
             )
 
-        # Search for each detected speaker
-        results = []
-        for emb in embeddings_result.embeddings:
-            matches = tracker.find_speaker(
-                embedding=emb.embedding,
-                threshold=threshold,
-                limit=limit,
-            )
-            results.append({
-                "session_speaker": emb.speaker,
-                "matches": matches,
-            })
+        # Search all detected speakers in one batched Milvus call
+        match_lists = tracker.find_speakers_batch(
+            np.asarray(
+                [emb.embedding for emb in embeddings_result.embeddings],
+                dtype=np.float32,
+            ),
+            threshold=threshold,
+            limit=limit,
+        )
+        results = [
+            {"session_speaker": emb.speaker, "matches": matches}
+            for emb, matches in zip(embeddings_result.embeddings, match_lists)
+        ]
 
         return {"results": results}
 
@@ -745,7 +938,10 @@ async def delete_speaker(speaker_id: str):
             detail="Speaker tracking unavailable. Milvus not connected.",
         )
 
-    count = tracker.delete_speaker(speaker_id)
+    try:
+        count = tracker.delete_speaker(speaker_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"message": f"Deleted {count} embeddings for speaker {speaker_id}"}
 
 
@@ -789,6 +985,74 @@ async def add_speaker_embedding(
     }
 
 
+@app.post("/v1/speakers/add_batch")
+async def add_speaker_embeddings(request: BatchAddRequest):
+    """
+    Add multiple speaker embeddings in one Milvus insert.
+
+    Embeddings can be sent as JSON lists or, for bulk imports, as a
+    single base64 string of packed little-endian float16 values
+    (N x 256), which skips per-float JSON parsing entirely.
+    """
+    tracker = get_speaker_tracker()
+    if tracker is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Speaker tracking unavailable. Milvus not connected.",
+        )
+
+    if request.embeddings_f16_b64 is not None:
+        try:
+            arr = np.frombuffer(
+                base64.b64decode(request.embeddings_f16_b64), dtype=np.float16
+            )
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid base64 embedding data")
+        if arr.size == 0 or arr.size % 256 != 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Packed embeddings must be a multiple of 256 floats, got {arr.size}",
+            )
+        arr = arr.reshape(-1, 256).astype(np.float32)
+    elif request.embeddings:
+        arr = np.asarray(request.embeddings, dtype=np.float32)
+        if arr.ndim != 2 or arr.shape[1] != 256:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Embeddings must be 256-dimensional, got shape {arr.shape}",
+            )
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Either embeddings or embeddings_f16_b64 is required",
+        )
+
+    for name, values in (
+        ("speaker_ids", request.speaker_ids),
+        ("speaker_names", request.speaker_names),
+        ("session_speakers", request.session_speakers),
+    ):
+        if values is not None and len(values) != len(arr):
+            raise HTTPException(
+                status_code=400,
+                detail=f"{name} must have one entry per embedding ({len(arr)})",
+            )
+
+    speaker_ids = tracker.add_speakers(
+        arr,
+        speaker_ids=request.speaker_ids,
+        speaker_names=request.speaker_names,
+        recording_id=request.recording_id,
+        session_speakers=request.session_speakers,
+    )
+
+    return {
+        "speaker_ids": speaker_ids,
+        "count": len(speaker_ids),
+        "message": "Speaker embeddings added successfully",
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -4,20 +4,15 @@ This module provides speaker identification across recordings by storing
 and searching speaker embeddings in Milvus.
 """
 
+import json
 import os
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import uuid4
 
-from pymilvus import (
-    Collection,
-    CollectionSchema,
-    DataType,
-    FieldSchema,
-    MilvusClient,
-    connections,
-    utility,
-)
+import numpy as np
+from pymilvus import DataType, MilvusClient
 
 # Configuration from environment
 MILVUS_HOST = os.getenv("MILVUS_HOST", "milvus.milvus.svc.cluster.local")
@@ -28,29 +23,44 @@ EMBEDDING_DIM = 256  # pyannote speaker embedding dimension
 # Similarity threshold for speaker matching (cosine similarity)
 SIMILARITY_THRESHOLD = float(os.getenv("SPEAKER_SIMILARITY_THRESHOLD", "0.85"))
 
+# Serialized form of the common no-metadata case, so inserts inside
+# diarization loops skip a json.dumps call
+_EMPTY_META_JSON = "{}"
+
+# Speaker IDs are generated as spk_<hex> but may be caller-supplied
+_SPEAKER_ID_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+# HNSW index tuning (graph degree / build beam / search beam)
+HNSW_M = int(os.getenv("MILVUS_HNSW_M", "24"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("MILVUS_HNSW_EF_CONSTRUCTION", "128"))
+HNSW_EF = int(os.getenv("MILVUS_HNSW_EF", "100"))
+
+
+def _normalize(embedding: Union[list[float], np.ndarray]) -> np.ndarray:
+    """Cast to float32 and scale to unit length (no-op for zero vectors)."""
+    embedding = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm > 0 else embedding
+
 
 class SpeakerTracker:
     """Track speakers across recordings using Milvus vector search."""
 
     def __init__(self):
         self.client: Optional[MilvusClient] = None
-        self.collection: Optional[Collection] = None
         self._connected = False
+        # Matches the collection's vector field; float16 halves index
+        # RAM with negligible recall loss on unit-norm embeddings.
+        self._vector_dtype = np.float16
 
     def connect(self) -> bool:
         """Connect to Milvus and ensure collection exists."""
         try:
-            # Connect using MilvusClient for simpler API
+            # One long-lived MilvusClient channel serves everything;
+            # the legacy connections/Collection path is gone.
             uri = f"http://{MILVUS_HOST}:{MILVUS_PORT}"
             self.client = MilvusClient(uri=uri)
 
-            # Also create legacy connection for Collection operations
-            connections.connect(
-                alias="default",
-                host=MILVUS_HOST,
-                port=MILVUS_PORT,
-            )
-
             # Ensure collection exists
             self._ensure_collection()
             self._connected = True
@@ -63,89 +73,108 @@ class SpeakerTracker:
 
     def _ensure_collection(self):
         """Create the speaker embeddings collection if it doesn't exist."""
-        if utility.has_collection(COLLECTION_NAME):
-            self.collection = Collection(COLLECTION_NAME)
-            self.collection.load()
+        if self.client.has_collection(COLLECTION_NAME):
+            # Collections created before the FP16 switch store float32
+            desc = self.client.describe_collection(COLLECTION_NAME)
+            for field in desc.get("fields", []):
+                if field.get("name") == "embedding" and field.get("type") == DataType.FLOAT_VECTOR:
+                    self._vector_dtype = np.float32
+            self._migrate_index()
+            self.client.load_collection(COLLECTION_NAME)
             return
 
         # Define schema
-        fields = [
-            FieldSchema(
-                name="id",
-                dtype=DataType.VARCHAR,
-                is_primary=True,
-                max_length=64,
-            ),
-            FieldSchema(
-                name="speaker_id",
-                dtype=DataType.VARCHAR,
-                max_length=128,
-                description="Persistent speaker identifier",
-            ),
-            FieldSchema(
-                name="speaker_name",
-                dtype=DataType.VARCHAR,
-                max_length=256,
-                description="Human-readable speaker name",
-            ),
-            FieldSchema(
-                name="recording_id",
-                dtype=DataType.VARCHAR,
-                max_length=256,
-                description="Source recording identifier",
-            ),
-            FieldSchema(
-                name="session_speaker",
-                dtype=DataType.VARCHAR,
-                max_length=64,
-                description="Original session speaker label (SPEAKER_00, etc.)",
-            ),
-            FieldSchema(
-                name="embedding",
-                dtype=DataType.FLOAT_VECTOR,
-                dim=EMBEDDING_DIM,
-            ),
-            FieldSchema(
-                name="created_at",
-                dtype=DataType.VARCHAR,
-                max_length=32,
-            ),
-            FieldSchema(
-                name="metadata",
-                dtype=DataType.VARCHAR,
-                max_length=2048,
-                description="JSON metadata",
-            ),
-        ]
-
-        schema = CollectionSchema(
-            fields=fields,
+        schema = MilvusClient.create_schema(
             description="Speaker embeddings for cross-recording identification",
         )
-
-        self.collection = Collection(
-            name=COLLECTION_NAME,
-            schema=schema,
+        schema.add_field("id", DataType.VARCHAR, is_primary=True, max_length=64)
+        schema.add_field(
+            "speaker_id",
+            DataType.VARCHAR,
+            max_length=128,
+            description="Persistent speaker identifier",
+        )
+        schema.add_field(
+            "speaker_name",
+            DataType.VARCHAR,
+            max_length=256,
+            description="Human-readable speaker name",
+        )
+        schema.add_field(
+            "recording_id",
+            DataType.VARCHAR,
+            max_length=256,
+            description="Source recording identifier",
+        )
+        schema.add_field(
+            "session_speaker",
+            DataType.VARCHAR,
+            max_length=64,
+            description="Original session speaker label (SPEAKER_00, etc.)",
+        )
+        schema.add_field("embedding", DataType.FLOAT16_VECTOR, dim=EMBEDDING_DIM)
+        schema.add_field("created_at", DataType.VARCHAR, max_length=32)
+        schema.add_field(
+            "metadata",
+            DataType.VARCHAR,
+            max_length=2048,
+            description="JSON metadata",
         )
 
-        # Create index for vector search
-        index_params = {
-            "metric_type": "COSINE",
-            "index_type": "IVF_FLAT",
-            "params": {"nlist": 128},
-        }
-        self.collection.create_index(
+        # Create index for vector search. HNSW keeps per-query cost
+        # roughly logarithmic in collection size, where IVF_FLAT at low
+        # nprobe degrades to linear scans with poor recall. Vectors are
+        # unit-normalized at insert time, so IP == cosine similarity
+        # without per-probe normalization work.
+        index_params = self.client.prepare_index_params()
+        index_params.add_index(
             field_name="embedding",
+            index_type="HNSW",
+            metric_type="IP",
+            params={"M": HNSW_M, "efConstruction": HNSW_EF_CONSTRUCTION},
+        )
+
+        self.client.create_collection(
+            collection_name=COLLECTION_NAME,
+            schema=schema,
             index_params=index_params,
         )
 
         # Load collection for searching
-        self.collection.load()
+        self.client.load_collection(COLLECTION_NAME)
         print(f"Created collection: {COLLECTION_NAME}")
 
+    def _migrate_index(self):
+        """Rebuild the embedding index if an older IVF_FLAT/COSINE one exists."""
+        try:
+            for index_name in self.client.list_indexes(COLLECTION_NAME):
+                info = self.client.describe_index(COLLECTION_NAME, index_name)
+                if info.get("field_name") != "embedding":
+                    continue
+                index_type = info.get("index_type")
+                metric = info.get("metric_type")
+                if index_type != "HNSW" or metric != "IP":
+                    print(
+                        f"Migrating speaker embedding index from "
+                        f"{index_type}/{metric} to HNSW/IP"
+                    )
+                    self.client.release_collection(COLLECTION_NAME)
+                    self.client.drop_index(COLLECTION_NAME, index_name)
+                    index_params = self.client.prepare_index_params()
+                    index_params.add_index(
+                        field_name="embedding",
+                        index_type="HNSW",
+                        metric_type="IP",
+                        params={"M": HNSW_M, "efConstruction": HNSW_EF_CONSTRUCTION},
+                    )
+                    self.client.create_index(COLLECTION_NAME, index_params)
+                    break
+        except Exception as e:
+            print(f"Index migration check failed (continuing with existing index): {e}")
+
     def find_speaker(
         self,
-        embedding: list[float],
+        embedding: Union[list[float], np.ndarray],
         threshold: Optional[float] = None,
         limit: int = 5,
     ) -> list[dict]:
@@ -160,24 +189,59 @@ class SpeakerTracker:
         Returns:
             List of matching speakers with similarity scores
         """
+        return self.find_speakers_batch([embedding], threshold=threshold, limit=limit)[0]
+
+    def find_speakers_batch(
+        self,
+        embeddings: Union[list[list[float]], np.ndarray],
+        threshold: Optional[float] = None,
+        limit: int = 5,
+    ) -> list[list[dict]]:
+        """
+        Search for matching speakers for several embeddings in one call.
+
+        Milvus supports multi-query search natively, so batching N
+        embeddings costs one RPC instead of N.
+
+        Args:
+            embeddings: List of 256-dim speaker embedding vectors
+            threshold: Minimum similarity score (default: SIMILARITY_THRESHOLD)
+            limit: Maximum number of results per embedding
+
+        Returns:
+            One list of matches per input embedding, in input order
+        """
         if not self._connected:
             raise RuntimeError("Not connected to Milvus")
 
         if threshold is None:
             threshold = SIMILARITY_THRESHOLD
 
+        if len(embeddings) == 0:
+            return []
+
+        # A contiguous float32 array lets pymilvus memcpy the vectors
+        # instead of boxing 256 Python floats per embedding. Queries are
+        # unit-normalized to match the stored vectors (IP == cosine).
+        data = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(data, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        data = (data / norms).astype(self._vector_dtype)
+
         results = self.client.search(
             collection_name=COLLECTION_NAME,
-            data=[embedding],
+            data=list(data),
             limit=limit,
             output_fields=["speaker_id", "speaker_name", "recording_id", "session_speaker", "created_at"],
+            search_params={"metric_type": "IP", "params": {"ef": HNSW_EF}},
         )
 
-        matches = []
+        all_matches = []
         for hits in results:
+            matches = []
             for hit in hits:
-                # Cosine similarity: higher is better, range [0, 1] after normalization
-                similarity = 1 - hit["distance"]  # Convert distance to similarity
+                # IP on unit vectors is cosine similarity: higher is better
+                similarity = hit["distance"]
                 if similarity >= threshold:
                     matches.append({
                         "id": hit["id"],
@@ -188,12 +252,13 @@ class SpeakerTracker:
                         "similarity": similarity,
                         "created_at": hit["entity"].get("created_at"),
                     })
+            all_matches.append(matches)
 
-        return matches
+        return all_matches
 
     def add_speaker(
         self,
-        embedding: list[float],
+        embedding: Union[list[float], np.ndarray],
         speaker_id: Optional[str] = None,
         speaker_name: Optional[str] = None,
         recording_id: Optional[str] = None,
@@ -217,8 +282,6 @@ class SpeakerTracker:
         if not self._connected:
             raise RuntimeError("Not connected to Milvus")
 
-        import json
-
         record_id = str(uuid4())
         speaker_id = speaker_id or f"spk_{uuid4().hex[:12]}"
 
@@ -228,9 +291,11 @@ class SpeakerTracker:
             "speaker_name": speaker_name or "",
             "recording_id": recording_id or "",
             "session_speaker": session_speaker or "",
-            "embedding": embedding,
+            "embedding": _normalize(embedding).astype(self._vector_dtype),
             "created_at": datetime.utcnow().isoformat(),
-            "metadata": json.dumps(metadata or {}),
+            "metadata": _EMPTY_META_JSON
+            if not metadata
+            else json.dumps(metadata, separators=(",", ":")),
         }
 
         self.client.insert(
@@ -240,9 +305,62 @@ class SpeakerTracker:
 
         return speaker_id
 
+    def add_speakers(
+        self,
+        embeddings: Union[list[list[float]], np.ndarray],
+        speaker_ids: Optional[list[Optional[str]]] = None,
+        speaker_names: Optional[list[Optional[str]]] = None,
+        recording_id: Optional[str] = None,
+        session_speakers: Optional[list[Optional[str]]] = None,
+    ) -> list[str]:
+        """
+        Add many speaker embeddings in a single insert RPC.
+
+        Args:
+            embeddings: (N, 256) array or list of embedding vectors
+            speaker_ids: Per-row persistent IDs (generated where None)
+            speaker_names: Per-row human-readable names (optional)
+            recording_id: Source recording identifier for all rows
+            session_speakers: Per-row original labels (SPEAKER_00, etc.)
+
+        Returns:
+            The speaker_id for each row, in input order
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Milvus")
+
+        arr = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(arr, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        arr = (arr / norms).astype(self._vector_dtype)
+
+        now = datetime.utcnow().isoformat()
+        out_ids = []
+        rows = []
+        for i in range(len(arr)):
+            sid = (speaker_ids[i] if speaker_ids else None) or f"spk_{uuid4().hex[:12]}"
+            out_ids.append(sid)
+            rows.append({
+                "id": str(uuid4()),
+                "speaker_id": sid,
+                "speaker_name": (speaker_names[i] if speaker_names else None) or "",
+                "recording_id": recording_id or "",
+                "session_speaker": (session_speakers[i] if session_speakers else None) or "",
+                "embedding": arr[i],
+                "created_at": now,
+                "metadata": _EMPTY_META_JSON,
+            })
+
+        self.client.insert(
+            collection_name=COLLECTION_NAME,
+            data=rows,
+        )
+
+        return out_ids
+
     def identify_or_create(
         self,
-        embedding: list[float],
+        embedding: Union[list[float], np.ndarray],
         recording_id: Optional[str] = None,
         session_speaker: Optional[str] = None,
         threshold: Optional[float] = None,
@@ -309,30 +427,42 @@ class SpeakerTracker:
         return False
 
     def get_all_speakers(self, limit: int = 1000) -> list[dict]:
-        """Get all unique speakers."""
+        """Get all unique speakers.
+
+        Streams the collection through a query iterator and groups rows
+        by speaker_id as they arrive, so the limit bounds unique
+        speakers rather than raw embedding rows.
+        """
         if not self._connected:
             raise RuntimeError("Not connected to Milvus")
 
-        results = self.client.query(
+        speakers = {}
+        iterator = self.client.query_iterator(
             collection_name=COLLECTION_NAME,
-            filter="",
             output_fields=["speaker_id", "speaker_name", "recording_id", "created_at"],
-            limit=limit,
+            batch_size=500,
         )
-
-        # Deduplicate by speaker_id
-        speakers = {}
-        for r in results:
-            sid = r["speaker_id"]
-            if sid not in speakers:
-                speakers[sid] = {
-                    "speaker_id": sid,
-                    "speaker_name": r.get("speaker_name"),
-                    "recordings": [],
-                    "first_seen": r.get("created_at"),
-                }
-            if r.get("recording_id"):
-                speakers[sid]["recordings"].append(r["recording_id"])
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                for r in batch:
+                    sid = r["speaker_id"]
+                    entry = speakers.get(sid)
+                    if entry is None:
+                        if len(speakers) >= limit:
+                            continue
+                        entry = speakers[sid] = {
+                            "speaker_id": sid,
+                            "speaker_name": r.get("speaker_name"),
+                            "recordings": [],
+                            "first_seen": r.get("created_at"),
+                        }
+                    if r.get("recording_id"):
+                        entry["recordings"].append(r["recording_id"])
+        finally:
+            iterator.close()
 
         return list(speakers.values())
 
@@ -341,30 +471,55 @@ class SpeakerTracker:
         if not self._connected:
             raise RuntimeError("Not connected to Milvus")
 
+        if not _SPEAKER_ID_RE.match(speaker_id):
+            raise ValueError(f"Invalid speaker_id: {speaker_id!r}")
+
+        # Parameterized filter: keeps the expression constant so Milvus
+        # can reuse its plan, and avoids interpolating user input.
         result = self.client.delete(
             collection_name=COLLECTION_NAME,
-            filter=f'speaker_id == "{speaker_id}"',
+            filter="speaker_id == {sid}",
+            filter_params={"sid": speaker_id},
         )
         return result.get("delete_count", 0)
 
+    def ping(self) -> bool:
+        """Cheap liveness check that reuses the existing client channel."""
+        if not self._connected:
+            return False
+        try:
+            self.client.has_collection(COLLECTION_NAME)
+            return True
+        except Exception:
+            return False
+
     def get_collection_stats(self) -> dict:
         """Get collection statistics."""
         if not self._connected:
             return {"connected": False}
 
-        stats = self.collection.num_entities
+        try:
+            # Reuse the long-lived MilvusClient channel rather than the
+            # legacy Collection object (which opens its own connection).
+            stats = self.client.get_collection_stats(COLLECTION_NAME)
+        except Exception as e:
+            return {"connected": False, "error": str(e)}
+
         return {
             "connected": True,
             "collection": COLLECTION_NAME,
-            "total_embeddings": stats,
+            "total_embeddings": stats.get("row_count", 0),
             "embedding_dim": EMBEDDING_DIM,
+            # float16 halves vector RAM; recall loss is negligible on
+            # unit-norm embeddings but not zero
+            "embedding_dtype": np.dtype(self._vector_dtype).name,
             "similarity_threshold": SIMILARITY_THRESHOLD,
         }
 
     def close(self):
         """Close Milvus connection."""
         if self._connected:
-            connections.disconnect("default")
+            self.client.close()
             self._connected = False
 
 
@@ -18,22 +18,63 @@ Examples:
 """
 
 import argparse
-import json
+import asyncio
 import sys
 import time
 from typing import Optional
 
-import requests
+import httpx
 
-# Suppress SSL warnings for self-signed certs
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Key paths into the response shapes served by /v1/score and /v1/rerank;
+# walked in order, first hit wins.
+_SCORE_PATHS = (
+    ("score",),
+    ("data", 0, "score"),
+    ("results", 0, "relevance_score"),
+)
 
-def get_score(url: str, model: str, query: str, document: str) -> Optional[float]:
+
+def _extract_score(result) -> Optional[float]:
+    """Pull a relevance score out of any known response shape."""
+    for path in _SCORE_PATHS:
+        cur = result
+        try:
+            for key in path:
+                cur = cur[key]
+            return float(cur)
+        except (KeyError, IndexError, TypeError):
+            continue
+    return None
+
+
+# Repeated (query, document) pairs skip the network entirely; failures
+# are never cached, so they get retried.
+_use_cache = True
+_score_cache: dict[tuple[str, str, str, str], float] = {}
+
+
+def make_client() -> httpx.AsyncClient:
+    """One shared client: keep-alive skips the TLS handshake on every
+    scoring call, which dominates latency for short documents."""
+    return httpx.AsyncClient(
+        verify=False,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+        transport=httpx.AsyncHTTPTransport(verify=False, retries=2),
+    )
+
+
+async def get_score(
+    client: httpx.AsyncClient, url: str, model: str, query: str, document: str
+) -> Optional[float]:
     """Get relevance score from vLLM /v1/score endpoint."""
+    key = (url, model, query, document)
+    if _use_cache and key in _score_cache:
+        return _score_cache[key]
+
     try:
-        response = requests.post(
+        response = await client.post(
             f"{url}/v1/score",
             json={
                 "model": model,
@@ -41,38 +82,74 @@ def get_score(url: str, model: str, query: str, document: str) -> Optional[float
                 "text_2": document
             },
             headers={"Content-Type": "application/json"},
-            verify=False,
-            timeout=30
         )
         response.raise_for_status()
-        result = response.json()
-        # The score format may vary - try common patterns
-        if "score" in result:
-            return result["score"]
-        elif "data" in result and len(result["data"]) > 0:
-            return result["data"][0].get("score")
-        else:
-            print(f"Unexpected response format: {result}")
+        score = _extract_score(response.json())
+        if score is None:
+            print(f"Unexpected response format: {response.json()}")
             return None
+        if _use_cache:
+            _score_cache[key] = score
+        return score
     except Exception as e:
         print(f"Error getting score: {e}")
         return None
 
 
-def rerank_documents(url: str, model: str, query: str, documents: list[str]) -> list[tuple[int, float, str]]:
+async def rerank_documents_batch(
+    client: httpx.AsyncClient, url: str, model: str, query: str, documents: list[str]
+) -> Optional[list[tuple[int, float, str]]]:
+    """Score all documents in a single /v1/rerank call.
+
+    Returns None when the endpoint is unavailable so the caller can fall
+    back to per-document scoring.
+    """
+    try:
+        response = await client.post(
+            f"{url}/v1/rerank",
+            json={"model": model, "query": query, "documents": documents},
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        results = response.json().get("results", [])
+        scored = [
+            (r["index"], r["relevance_score"], documents[r["index"]])
+            for r in results
+        ]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored or None
+    except Exception as e:
+        print(f"Batch rerank unavailable ({e}), falling back to per-document scoring")
+        return None
+
+
+async def rerank_documents(
+    client: httpx.AsyncClient, url: str, model: str, query: str, documents: list[str]
+) -> list[tuple[int, float, str]]:
     """Rerank documents by relevance to query."""
-    scored = []
-    for i, doc in enumerate(documents):
-        score = get_score(url, model, query, doc)
-        if score is not None:
-            scored.append((i, score, doc))
+    # Preferred: one batched request scores everything server-side
+    scored = await rerank_documents_batch(client, url, model, query, documents)
+    if scored is not None:
+        return scored
+
+    # Fallback: fan out independent /v1/score calls concurrently instead
+    # of paying one round-trip per document sequentially
+    scores = await asyncio.gather(
+        *(get_score(client, url, model, query, d) for d in documents)
+    )
+
+    scored = [
+        (i, score, doc)
+        for i, (score, doc) in enumerate(zip(scores, documents))
+        if score is not None
+    ]
 
     # Sort by score descending
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored
 
 
-def run_tests(url: str, model: str):
+async def run_tests(client: httpx.AsyncClient, url: str, model: str):
     """Run reranker quality tests."""
 
     print("=" * 60)
@@ -86,8 +163,8 @@ def run_tests(url: str, model: str):
     print("-" * 40)
 
     try:
-        response = requests.get(f"{url}/health", verify=False, timeout=10)
-        if response.ok:
+        response = await client.get(f"{url}/health", timeout=10)
+        if response.is_success:
             print("  ✓ Server is healthy")
         else:
             print(f"  ✗ Health check failed: {response.status_code}")
@@ -109,7 +186,7 @@ def run_tests(url: str, model: str):
 
     for query, doc in test_pairs:
         start = time.time()
-        score = get_score(url, model, query, doc)
+        score = await get_score(client, url, model, query, doc)
         latency = (time.time() - start) * 1000
 
         if score is not None:
@@ -137,7 +214,7 @@ def run_tests(url: str, model: str):
     print(f"  Documents to rank: {len(documents)}")
     print()
 
-    ranked = rerank_documents(url, model, query, documents)
+    ranked = await rerank_documents(client, url, model, query, documents)
 
     if ranked:
         print("  Ranking results (highest relevance first):")
@@ -164,10 +241,13 @@ def run_tests(url: str, model: str):
     print("-" * 40)
 
     start = time.time()
-    success = 0
-    for i in range(10):
-        if get_score(url, model, "Test query", f"Test document {i}"):
-            success += 1
+    results = await asyncio.gather(
+        *(
+            get_score(client, url, model, "Test query", f"Test document {i}")
+            for i in range(10)
+        )
+    )
+    success = sum(1 for r in results if r is not None)
 
     elapsed = time.time() - start
     throughput = success / elapsed
@@ -182,14 +262,24 @@ def run_tests(url: str, model: str):
     return True
 
 
+async def amain(url: str, model: str) -> bool:
+    async with make_client() as client:
+        return await run_tests(client, url, model)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Test vLLM reranker quality")
     parser.add_argument("--url", required=True, help="vLLM server URL")
     parser.add_argument("--model", required=True, help="Model name")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable score memoization for clean latency numbers")
 
     args = parser.parse_args()
 
-    success = run_tests(args.url, args.model)
+    global _use_cache
+    _use_cache = not args.no_cache
+
+    success = asyncio.run(amain(args.url, args.model))
     sys.exit(0 if success else 1)
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from pathlib import Path
 from typing import Optional
@@ -53,3 +54,11 @@ class UnifiedMCPServer:
         if observer:
             observer.stop()
             observer.join(timeout=2)
+
+        # Release the shared vector-gateway connection pool
+        try:
+            from lib.vector_client import aclose_vector_client
+
+            asyncio.run(aclose_vector_client())
+        except Exception as exc:
+            log.debug(f"vector client close skipped: {exc}")
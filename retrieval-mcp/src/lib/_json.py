@@ -0,0 +1,32 @@
+"""JSON helpers backed by orjson when available.
+
+orjson is a C-extension encoder/decoder that is several times faster
+than the stdlib on the large detailed responses this server produces.
+It is listed as a dependency, but the stdlib fallback keeps the server
+working in environments where the wheel isn't installed.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally indented for humans."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally indented for humans."""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
@@ -1,7 +1,66 @@
 """Citation formatters for search results."""
 
-import json
-from typing import Any
+from typing import Any, Iterator
+
+from . import _json
+
+
+# Shared sentinel so hits without metadata don't allocate a dict each
+_EMPTY: dict[str, Any] = {}
+
+
+def _extract(hit: dict[str, Any]) -> tuple[str, int, dict[str, Any]]:
+    """Resolve (file_name, page, entity) for a hit in one walk.
+
+    The gateway emits flat metadata, so the fast path reads fields
+    directly; the nested-entity branch is a compatibility shim for
+    responses from older gateways and can go once those are retired.
+    """
+    metadata = hit.get("metadata") or _EMPTY
+    entity = metadata.get("entity")
+    if entity is None:
+        return metadata.get("file_name") or "", metadata.get("page", -1), metadata
+
+    # Legacy nested shape: entity fields win, outer metadata fills gaps
+    file_name = entity.get("file_name") or metadata.get("file_name") or ""
+    page = entity.get("page", -1)
+    if page == -1:
+        page = metadata.get("page", -1)
+    return file_name, page, entity
+
+
+def filter_by_score(
+    hits: list[dict[str, Any]], min_score: float
+) -> list[dict[str, Any]]:
+    """Drop hits scoring below min_score.
+
+    Single comprehension over at most top_k (<= 20) hits; the heavy
+    filtering happens gateway-side, this is the client-side safety net.
+    """
+    if min_score <= 0.0:
+        return hits
+    return [h for h in hits if h.get("score", 0.0) >= min_score]
+
+
+def _format_hit(i: int, hit: dict[str, Any]) -> str:
+    """Build the multi-line citation block for one hit."""
+    file_name, page, _ = _extract(hit)
+    file_name = file_name or "Unknown"
+
+    lines = [f'[{i}] "{hit.get("text", "")}"']
+    if page >= 0:
+        lines.append(f"    Source: {file_name}, Page {page}")
+    else:
+        lines.append(f"    Source: {file_name}")
+
+    # Include surrounding context if available
+    surrounding = hit.get("surrounding_chunks", [])
+    if surrounding:
+        n_context = sum(1 for c in surrounding if c.get("text"))
+        if n_context:
+            lines.append(f"    Context: {n_context} adjacent chunks available")
+
+    return "\n".join(lines)
 
 
 def format_concise(hits: list[dict[str, Any]]) -> str:
@@ -24,35 +83,18 @@ def format_concise(hits: list[dict[str, Any]]) -> str:
     if not hits:
         return "No results found."
 
-    lines = []
-    for i, hit in enumerate(hits, 1):
-        text = hit.get("text", "")
-        metadata = hit.get("metadata", {})
-
-        # Extract file_name and page from nested entity or direct metadata
-        entity = metadata.get("entity", metadata)
-        file_name = entity.get("file_name", "") or metadata.get("file_name", "Unknown")
-        page = entity.get("page", -1)
-        if page == -1:
-            page = metadata.get("page", -1)
-
-        # Format the citation
-        lines.append(f'[{i}] "{text}"')
-        if page >= 0:
-            lines.append(f"    Source: {file_name}, Page {page}")
-        else:
-            lines.append(f"    Source: {file_name}")
-
-        # Include surrounding context if available
-        surrounding = hit.get("surrounding_chunks", [])
-        if surrounding:
-            context_texts = [c.get("text", "") for c in surrounding if c.get("text")]
-            if context_texts:
-                lines.append(f"    Context: {len(context_texts)} adjacent chunks available")
+    # One preformatted block per hit, one join for the whole response
+    return "\n\n".join(iter_concise(hits))
 
-        lines.append("")  # Blank line between results
 
-    return "\n".join(lines).strip()
+def iter_concise(hits: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield one formatted citation block per hit, lazily.
+
+    Lets callers stream large result lists without materializing the
+    whole response string first; format_concise joins this same stream.
+    """
+    for i, hit in enumerate(hits, 1):
+        yield _format_hit(i, hit)
 
 
 def format_detailed(hits: list[dict[str, Any]], latency_ms: int = 0) -> str:
@@ -66,25 +108,22 @@ def format_detailed(hits: list[dict[str, Any]], latency_ms: int = 0) -> str:
     Returns:
         JSON string with full metadata
     """
-    results = []
-    for hit in hits:
-        metadata = hit.get("metadata", {})
-        entity = metadata.get("entity", metadata)
-
+    def _detail(hit: dict[str, Any]) -> dict[str, Any]:
+        file_name, page, entity = _extract(hit)
         result = {
             "text": hit.get("text", ""),
             "score": hit.get("score", 0.0),
-            "file_name": entity.get("file_name", "") or metadata.get("file_name", ""),
-            "page": entity.get("page", -1),
+            "file_name": file_name,
+            "page": page,
             "chunk_index": entity.get("chunk_index", -1),
         }
-
         # Include surrounding context if present
         surrounding = hit.get("surrounding_chunks", [])
         if surrounding:
             result["surrounding_context"] = [c.get("text", "") for c in surrounding]
+        return result
 
-        results.append(result)
+    results = [_detail(hit) for hit in hits]
 
     output = {
         "results": results,
@@ -92,12 +131,14 @@ def format_detailed(hits: list[dict[str, Any]], latency_ms: int = 0) -> str:
         "query_time_ms": latency_ms,
     }
 
-    return json.dumps(output, indent=2)
+    # Compact output: the consumer is an agent, not a human reading the
+    # JSON, and indented output is noticeably slower to serialize
+    return _json.dumps(output)
 
 
 def format_collections_concise(collections: list[str]) -> str:
     """Format collection list as simple JSON array."""
-    return json.dumps(collections)
+    return _json.dumps(collections)
 
 
 def format_collections_detailed(
@@ -109,14 +150,20 @@ def format_collections_detailed(
     Use format_collections_detailed_async for async stats fetching.
     """
     # For sync use, just return the names
-    return json.dumps([{"name": c} for c in collections], indent=2)
+    return _json.dumps([{"name": c} for c in collections], indent=True)
 
 
 def format_sources_concise(file_names: list[str]) -> str:
     """Format source file list."""
     if not file_names:
         return "No sources found in this collection."
-    return "\n".join(f"- {name}" for name in file_names)
+    return "\n".join(iter_sources(file_names))
+
+
+def iter_sources(file_names: list[str]) -> Iterator[str]:
+    """Yield one bullet line per source file, lazily."""
+    for name in file_names:
+        yield f"- {name}"
 
 
 def format_sources_detailed(stats: dict[str, Any]) -> str:
@@ -132,4 +179,4 @@ def format_sources_detailed(stats: dict[str, Any]) -> str:
         "file_types": mime_types,
     }
 
-    return json.dumps(output, indent=2)
+    return _json.dumps(output, indent=True)
@@ -0,0 +1,83 @@
+"""In-process cache of recent search results for rag_search.
+
+Chatty agent loops re-issue the same (or near-identical) query several
+times per conversation; a hit here skips the whole embed + ANN + rerank
++ context-expand round-trip on the gateway. Entries are keyed by the
+normalized query plus the full filter shape so a cached result is only
+reused when it would be byte-identical, expire after a TTL, and are
+evicted LRU past a size cap.
+
+Enabled with RAG_SEMANTIC_CACHE=1. Matching is exact-key for now: the
+server has no local embedder, and embedding the query via the gateway
+would cost the same RTT the cache is meant to save. If an embed-only
+endpoint is added to VectorClient, similarity lookup over the stored
+keys can slot in behind the same get/put interface.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+def enabled() -> bool:
+    """Whether the search cache is switched on via environment."""
+    return os.getenv("RAG_SEMANTIC_CACHE", "0").lower() in {"1", "true", "yes"}
+
+
+def make_key(
+    query: str,
+    collection: str,
+    top_k: int,
+    context_window: int,
+    file_name: str | None,
+    file_pattern: str | None,
+    mime_type: str | None,
+    min_score: float = 0.0,
+) -> str:
+    """Digest of the query plus every parameter that shapes the result."""
+    raw = "\x00".join((
+        query.lower(),
+        collection,
+        str(top_k),
+        str(context_window),
+        file_name or "",
+        file_pattern or "",
+        mime_type or "",
+        str(min_score),
+    ))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class SearchCache:
+    """TTL + LRU cache mapping search keys to raw gateway responses."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        self._entries[key] = (result, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide instance shared by rag_search calls
+cache = SearchCache()
@@ -1,9 +1,22 @@
 """HTTP client for vector-gateway service."""
 
+import asyncio
 import os
+import time
 import httpx
 from typing import Any
 
+from . import _json
+
+# HTTP/2 needs the h2 extra (httpx[http2]); fall back to HTTP/1.1 when
+# only plain httpx is installed.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    _HTTP2 = False
+
 # Default to internal OpenShift service URL
 VECTOR_GATEWAY_URL = os.environ.get(
     "VECTOR_GATEWAY_URL",
@@ -26,12 +39,161 @@ class ServiceUnavailableError(VectorClientError):
     pass
 
 
+# One process-wide AsyncClient shared by every VectorClient instance.
+# Keep-alive connections avoid a TCP/TLS handshake and DNS lookup per tool
+# call; the pool is sized for concurrent tool fan-outs.
+_shared_client: httpx.AsyncClient | None = None
+
+
+# Response bodies above this size get parsed on a worker thread so a big
+# search result doesn't stall every other in-flight tool call.
+_PARSE_OFFLOAD_BYTES = 64 * 1024
+
+
+async def _read_json(resp: httpx.Response) -> Any:
+    body = resp.content
+    if len(body) > _PARSE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(_json.loads, body)
+    return _json.loads(body)
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            headers={"Accept-Encoding": "gzip, br"},
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _shared_client
+
+
+# Process-wide collection-list cache shared across instances; refreshed
+# at most once per TTL window
+_COLLECTIONS_TTL = 60.0
+_collections_cache: tuple[float, list[str]] | None = None
+_collections_lock = asyncio.Lock()
+
+# Per-collection stats cache keyed by (collection, limit, fields); stats
+# drift slowly (new ingests), so a short TTL lets bursts of
+# rag_list_sources / detailed rag_list_collections share one RTT.
+# No lock: concurrent misses just fetch twice, which beats serializing
+# the detailed-listing fan-out behind a single lock.
+_STATS_TTL = 30.0
+_stats_cache: dict[tuple[str, int | None, tuple[str, ...] | None], tuple[float, dict[str, Any]]] = {}
+
+
+def invalidate_stats_cache(collection: str | None = None) -> None:
+    """Drop cached stats, for one collection or all of them.
+
+    Call after stat-changing operations (upsert/delete) so the next
+    listing reflects the change before the TTL would.
+    """
+    if collection is None:
+        _stats_cache.clear()
+        return
+    for key in [k for k in _stats_cache if k[0] == collection]:
+        del _stats_cache[key]
+
+
+# Opt-in coalescing of concurrent searches into one /batch_search RPC
+# (RAG_BATCH_SEARCH=1). Calls sharing a bucket within the window ride a
+# single request; solo calls pay up to the window in added latency,
+# which is why this is off by default.
+_BATCH_WINDOW = 0.005
+_BATCH_MAX = 16
+_batch_supported = True
+
+
+def _coalescing_enabled() -> bool:
+    return os.environ.get("RAG_BATCH_SEARCH", "0").lower() in {"1", "true", "yes"}
+
+
+class _BatchCoalescer:
+    """Buckets pending searches by shared parameters and flushes each
+    bucket as one batch RPC when it fills or its window expires."""
+
+    def __init__(self, client: "VectorClient"):
+        self._client = client
+        self._buckets: dict[tuple, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[tuple, asyncio.TimerHandle] = {}
+
+    def submit(self, key: tuple, query: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        bucket = self._buckets.setdefault(key, [])
+        bucket.append((query, future))
+        if len(bucket) >= _BATCH_MAX:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(_BATCH_WINDOW, self._flush, key)
+        return future
+
+    def _flush(self, key: tuple) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        bucket = self._buckets.pop(key, None)
+        if bucket:
+            asyncio.ensure_future(self._run(key, bucket))
+
+    async def _run(self, key: tuple, bucket: list[tuple[str, asyncio.Future]]) -> None:
+        queries = [query for query, _ in bucket]
+        try:
+            outcomes = await self._client._batch_search(key, queries)
+        except Exception as exc:  # defensive: _batch_search returns errors
+            outcomes = [exc] * len(bucket)
+        if len(outcomes) < len(bucket):
+            # Defensive: zip would silently drop the excess futures and
+            # their callers would await forever; pad the tail instead
+            missing = len(bucket) - len(outcomes)
+            outcomes = outcomes + [
+                VectorClientError("Batch search returned fewer responses than queries")
+            ] * missing
+        for (_, future), outcome in zip(bucket, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+def peek_collections() -> list[str] | None:
+    """Return the cached collection list, or None if stale/unfetched.
+
+    Cache-only: never touches the network, so callers can use it to
+    fail fast on unknown collections.
+    """
+    cached = _collections_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
 class VectorClient:
-    """HTTP client for interacting with the vector-gateway service."""
+    """HTTP client for interacting with the vector-gateway service.
+
+    Instances are interned per (base_url, timeout) and all share a
+    single long-lived ``httpx.AsyncClient``, so constructing one anywhere
+    hands back the same pooled client.
+    """
+
+    _instances: dict[tuple[str, float], "VectorClient"] = {}
+
+    def __new__(cls, base_url: str | None = None, timeout: float = 30.0):
+        key = ((base_url or VECTOR_GATEWAY_URL).rstrip("/"), timeout)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+        return instance
 
     def __init__(self, base_url: str | None = None, timeout: float = 30.0):
         self.base_url = (base_url or VECTOR_GATEWAY_URL).rstrip("/")
         self.timeout = timeout
+        self._client = _get_shared_client()
+        self._coalescer = _BatchCoalescer(self)
 
     async def search(
         self,
@@ -42,6 +204,8 @@ class VectorClient:
         file_name: str | None = None,
         file_pattern: str | None = None,
         mime_type: str | None = None,
+        min_score: float = 0.0,
+        query_embedding: list[float] | None = None,
     ) -> dict[str, Any]:
         """
         Search for documents in a collection.
@@ -54,6 +218,9 @@ class VectorClient:
             file_name: Filter by exact file name
             file_pattern: Filter by glob pattern (e.g., "DMC-BRAKE*")
             mime_type: Filter by MIME type
+            min_score: Drop hits below this score gateway-side (0=disabled)
+            query_embedding: Pre-computed query embedding; lets the
+                gateway skip the embedding forward pass
 
         Returns:
             Search response with hits, count, latency_ms, etc.
@@ -63,12 +230,52 @@ class VectorClient:
             ServiceUnavailableError: If gateway is unreachable
             VectorClientError: For other errors
         """
+        # Concurrent calls sharing collection + parameters can ride one
+        # batch RPC; embedding-carrying calls always go direct
+        if query_embedding is None and _coalescing_enabled():
+            key = (
+                collection, top_k, context_window, min_score,
+                file_name, file_pattern, mime_type,
+            )
+            return await self._coalescer.submit(key, query)
+
+        return await self._search_request(
+            query=query,
+            collection=collection,
+            top_k=top_k,
+            context_window=context_window,
+            file_name=file_name,
+            file_pattern=file_pattern,
+            mime_type=mime_type,
+            min_score=min_score,
+            query_embedding=query_embedding,
+        )
+
+    async def _search_request(
+        self,
+        query: str,
+        collection: str,
+        top_k: int = 5,
+        context_window: int = 0,
+        file_name: str | None = None,
+        file_pattern: str | None = None,
+        mime_type: str | None = None,
+        min_score: float = 0.0,
+        query_embedding: list[float] | None = None,
+    ) -> dict[str, Any]:
+        """One direct /search POST; error mapping as in search()."""
         payload: dict[str, Any] = {
             "query": query,
             "collection": collection,
             "top_k": top_k,
             "context_window": context_window,
         }
+        # Threshold filtering happens gateway-side so rejected hits are
+        # never serialized or shipped; only sent when active
+        if min_score > 0.0:
+            payload["min_score"] = min_score
+        if query_embedding is not None:
+            payload["query_embedding"] = query_embedding
 
         # Build filters if any are provided
         filters = {}
@@ -82,15 +289,16 @@ class VectorClient:
             payload["filters"] = filters
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(f"{self.base_url}/search", json=payload)
+            resp = await self._client.post(
+                f"{self.base_url}/search", json=payload, timeout=self.timeout
+            )
 
-                if resp.status_code == 404:
-                    raise CollectionNotFoundError(
-                        f"Collection '{collection}' not found. Use rag_list_collections to see available collections."
-                    )
-                resp.raise_for_status()
-                return resp.json()
+            if resp.status_code == 404:
+                raise CollectionNotFoundError(
+                    f"Collection '{collection}' not found. Use rag_list_collections to see available collections."
+                )
+            resp.raise_for_status()
+            return await _read_json(resp)
 
         except httpx.ConnectError as exc:
             raise ServiceUnavailableError(
@@ -103,6 +311,87 @@ class VectorClient:
         except httpx.HTTPStatusError as exc:
             raise VectorClientError(f"Search failed: {exc.response.text}") from exc
 
+    async def _batch_search(self, key: tuple, queries: list[str]) -> list[Any]:
+        """Run a coalesced bucket; one response dict or exception per query.
+
+        Uses the gateway's /batch_search when available; a gateway that
+        predates the endpoint (404) downgrades to gathered single
+        searches for the rest of the process lifetime.
+        """
+        global _batch_supported
+        collection, top_k, context_window, min_score, file_name, file_pattern, mime_type = key
+
+        if len(queries) > 1 and _batch_supported:
+            payload: dict[str, Any] = {
+                "queries": queries,
+                "collection": collection,
+                "top_k": top_k,
+                "context_window": context_window,
+            }
+            if min_score > 0.0:
+                payload["min_score"] = min_score
+            filters = {}
+            if file_name:
+                filters["file_name"] = file_name
+            if file_pattern:
+                filters["file_pattern"] = file_pattern
+            if mime_type:
+                filters["mime_type"] = mime_type
+            if filters:
+                payload["filters"] = filters
+
+            try:
+                resp = await self._client.post(
+                    f"{self.base_url}/batch_search", json=payload, timeout=self.timeout
+                )
+                if resp.status_code == 404:
+                    # Endpoint not deployed on this gateway
+                    _batch_supported = False
+                else:
+                    resp.raise_for_status()
+                    data = await _read_json(resp)
+                    responses = data.get("responses", [])
+                    if len(responses) != len(queries):
+                        # A short (or missing) responses list would leave
+                        # some waiters unpaired; fail the whole bucket
+                        err = VectorClientError(
+                            f"Batch search returned {len(responses)} responses "
+                            f"for {len(queries)} queries"
+                        )
+                        return [err] * len(queries)
+                    return responses
+            except httpx.ConnectError:
+                exc = ServiceUnavailableError(
+                    "Vector search temporarily unavailable. Retry in a few seconds."
+                )
+                return [exc] * len(queries)
+            except httpx.TimeoutException:
+                exc = ServiceUnavailableError(
+                    "Vector search timed out. Try again with a smaller top_k or simpler query."
+                )
+                return [exc] * len(queries)
+            except httpx.HTTPStatusError as exc:
+                err = VectorClientError(f"Search failed: {exc.response.text}")
+                return [err] * len(queries)
+
+        # Single entry, or gateway without batch support: plain searches
+        return list(await asyncio.gather(
+            *(
+                self._search_request(
+                    query=query,
+                    collection=collection,
+                    top_k=top_k,
+                    context_window=context_window,
+                    file_name=file_name,
+                    file_pattern=file_pattern,
+                    mime_type=mime_type,
+                    min_score=min_score,
+                )
+                for query in queries
+            ),
+            return_exceptions=True,
+        ))
+
     async def list_collections(self) -> list[str]:
         """
         List all available collections.
@@ -114,11 +403,12 @@ class VectorClient:
             ServiceUnavailableError: If gateway is unreachable
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(f"{self.base_url}/collections")
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("collections", [])
+            resp = await self._client.get(
+                f"{self.base_url}/collections", timeout=self.timeout
+            )
+            resp.raise_for_status()
+            data = await _read_json(resp)
+            return data.get("collections", [])
 
         except httpx.ConnectError as exc:
             raise ServiceUnavailableError(
@@ -127,12 +417,48 @@ class VectorClient:
         except httpx.HTTPStatusError as exc:
             raise VectorClientError(f"Failed to list collections: {exc.response.text}") from exc
 
-    async def get_collection_stats(self, collection: str) -> dict[str, Any]:
+    async def cached_list_collections(self) -> list[str]:
+        """list_collections with a short process-wide TTL cache.
+
+        Repeated calls within the TTL are served from memory; a gateway
+        outage invalidates the cache so recovery isn't masked.
+
+        Raises:
+            ServiceUnavailableError: If gateway is unreachable
+        """
+        global _collections_cache
+        cached = peek_collections()
+        if cached is not None:
+            return cached
+        async with _collections_lock:
+            # Another caller may have refreshed while we waited
+            cached = peek_collections()
+            if cached is not None:
+                return cached
+            try:
+                collections = await self.list_collections()
+            except ServiceUnavailableError:
+                _collections_cache = None
+                raise
+            _collections_cache = (
+                time.monotonic() + _COLLECTIONS_TTL,
+                collections,
+            )
+            return collections
+
+    async def get_collection_stats(
+        self,
+        collection: str,
+        limit: int | None = None,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any]:
         """
         Get statistics for a collection.
 
         Args:
             collection: Collection name
+            limit: Cap the number of file_names the gateway returns
+            fields: Restrict the response to these stats fields
 
         Returns:
             Stats dict with name, row_count, file_names, mime_types
@@ -141,17 +467,36 @@ class VectorClient:
             CollectionNotFoundError: If collection doesn't exist
             ServiceUnavailableError: If gateway is unreachable
         """
+        # Serve repeat lookups from the short-TTL process cache
+        cache_key = (collection, limit, tuple(fields) if fields else None)
+        cached = _stats_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # Trim server-side so large collections don't ship (and we don't
+        # parse) thousands of file names the caller will slice away
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if fields:
+            params["fields"] = ",".join(fields)
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(f"{self.base_url}/collections/{collection}/stats")
+            resp = await self._client.get(
+                f"{self.base_url}/collections/{collection}/stats",
+                params=params,
+                timeout=self.timeout,
+            )
 
-                if resp.status_code == 404:
-                    raise CollectionNotFoundError(
-                        f"Collection '{collection}' not found. Use rag_list_collections to see available collections."
-                    )
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("stats", {})
+            if resp.status_code == 404:
+                raise CollectionNotFoundError(
+                    f"Collection '{collection}' not found. Use rag_list_collections to see available collections."
+                )
+            resp.raise_for_status()
+            data = await _read_json(resp)
+            stats = data.get("stats", {})
+            _stats_cache[cache_key] = (time.monotonic() + _STATS_TTL, stats)
+            return stats
 
         except httpx.ConnectError as exc:
             raise ServiceUnavailableError(
@@ -160,11 +505,81 @@ class VectorClient:
         except httpx.HTTPStatusError as exc:
             raise VectorClientError(f"Failed to get stats: {exc.response.text}") from exc
 
+    async def list_sources(self, collection: str, limit: int = 50) -> list[str]:
+        """
+        List source file names for a collection.
+
+        Cheaper than get_collection_stats when only file names are needed:
+        the gateway skips row-count aggregation and ships just the names.
+
+        Args:
+            collection: Collection name
+            limit: Maximum number of file names to return
+
+        Returns:
+            List of source file names
+
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist
+            ServiceUnavailableError: If gateway is unreachable
+        """
+        try:
+            resp = await self._client.get(
+                f"{self.base_url}/collections/{collection}/sources",
+                params={"limit": limit},
+                timeout=self.timeout,
+            )
+
+            if resp.status_code == 404:
+                raise CollectionNotFoundError(
+                    f"Collection '{collection}' not found. Use rag_list_collections to see available collections."
+                )
+            resp.raise_for_status()
+            data = await _read_json(resp)
+            return data.get("file_names", [])
+
+        except httpx.ConnectError as exc:
+            raise ServiceUnavailableError(
+                "Vector gateway temporarily unavailable. Retry in a few seconds."
+            ) from exc
+        except httpx.HTTPStatusError as exc:
+            raise VectorClientError(f"Failed to list sources: {exc.response.text}") from exc
+
     async def health_check(self) -> bool:
         """Check if the vector gateway is healthy."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(f"{self.base_url}/healthz")
-                return resp.status_code == 200
+            resp = await self._client.get(f"{self.base_url}/healthz", timeout=5.0)
+            return resp.status_code == 200
         except Exception:
             return False
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool (e.g. on server shutdown)."""
+        global _shared_client
+        if _shared_client is not None:
+            await _shared_client.aclose()
+            _shared_client = None
+
+
+# Process-wide VectorClient reused by every tool call; double-checked
+# lock so concurrent first calls don't race the construction.
+_client_lock = asyncio.Lock()
+_client_instance: VectorClient | None = None
+
+
+async def get_vector_client() -> VectorClient:
+    """Return the shared VectorClient, creating it on first use."""
+    global _client_instance
+    if _client_instance is None:
+        async with _client_lock:
+            if _client_instance is None:
+                _client_instance = VectorClient()
+    return _client_instance
+
+
+async def aclose_vector_client() -> None:
+    """Close the shared client and its pool (server shutdown)."""
+    global _client_instance
+    if _client_instance is not None:
+        await _client_instance.aclose()
+        _client_instance = None
@@ -1,17 +1,25 @@
 """Discover available document collections in the vector store."""
 
-import json
+import asyncio
 from typing import Annotated
 from pydantic import Field
 from fastmcp.exceptions import ToolError
 
 from core.app import mcp
+from lib import _json
 from lib.vector_client import (
-    VectorClient,
+    get_vector_client,
     ServiceUnavailableError,
     VectorClientError,
 )
 
+# Hoisted: membership set is built once, not per call
+_VALID_FORMATS = frozenset({"concise", "detailed"})
+
+# Cap on concurrent stats requests so a large collection count doesn't
+# swamp the gateway
+_STATS_CONCURRENCY = 16
+
 
 @mcp.tool(
     annotations={
@@ -37,10 +45,10 @@ async def rag_list_collections(
     Raises:
         ToolError: If the operation cannot be completed
     """
-    if response_format not in ("concise", "detailed"):
+    if response_format not in _VALID_FORMATS:
         raise ToolError("response_format must be 'concise' or 'detailed'")
 
-    client = VectorClient()
+    client = await get_vector_client()
     try:
         collections = await client.list_collections()
     except ServiceUnavailableError as exc:
@@ -52,21 +60,31 @@ async def rag_list_collections(
         return "No collections found. Use the ingest pipeline to add documents first."
 
     if response_format == "concise":
-        return json.dumps(collections)
+        return _json.dumps(collections)
     else:
-        # For detailed format, get stats for each collection
+        # For detailed format, fetch stats for all collections concurrently,
+        # capped so a large collection count doesn't swamp the gateway
+        sem = asyncio.Semaphore(_STATS_CONCURRENCY)
+
+        async def _stats(name: str) -> dict:
+            async with sem:
+                return await client.get_collection_stats(name)
+
+        stats_list = await asyncio.gather(
+            *(_stats(c) for c in collections),
+            return_exceptions=True,
+        )
         detailed_info = []
-        for coll_name in collections:
-            try:
-                stats = await client.get_collection_stats(coll_name)
+        for coll_name, stats in zip(collections, stats_list):
+            if isinstance(stats, BaseException):
+                # If we can't get stats, include minimal info
+                detailed_info.append({"name": coll_name})
+            else:
                 detailed_info.append({
                     "name": coll_name,
                     "document_count": len(stats.get("file_names", [])),
                     "chunk_count": stats.get("row_count", 0),
                     "file_types": stats.get("mime_types", []),
                 })
-            except Exception:
-                # If we can't get stats, include minimal info
-                detailed_info.append({"name": coll_name})
 
-        return json.dumps(detailed_info, indent=2)
+        return _json.dumps(detailed_info, indent=True)
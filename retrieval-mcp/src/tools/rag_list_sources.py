@@ -1,18 +1,21 @@
 """List documents within a specific collection."""
 
-import json
 from typing import Annotated
 from pydantic import Field
 from fastmcp.exceptions import ToolError
 
 from core.app import mcp
+from lib import _json
 from lib.vector_client import (
-    VectorClient,
+    get_vector_client,
     CollectionNotFoundError,
     ServiceUnavailableError,
     VectorClientError,
 )
 
+# Hoisted: membership sets are built once, not per call
+_VALID_FORMATS = frozenset({"concise", "detailed"})
+
 
 @mcp.tool(
     annotations={
@@ -43,19 +46,30 @@ async def rag_list_sources(
     Raises:
         ToolError: If validation fails or operation cannot be completed
     """
-    # Validate inputs
-    if not collection or not collection.strip():
+    # Validate inputs (strip once, reuse below)
+    collection = collection.strip() if collection else ""
+    if not collection:
         raise ToolError("Collection name is required")
 
-    if response_format not in ("concise", "detailed"):
+    if response_format not in _VALID_FORMATS:
         raise ToolError("response_format must be 'concise' or 'detailed'")
 
     if limit < 1 or limit > 500:
         raise ToolError("limit must be between 1 and 500")
 
-    client = VectorClient()
+    client = await get_vector_client()
     try:
-        stats = await client.get_collection_stats(collection.strip())
+        if response_format == "concise":
+            # Cheap path: only file names, no stats aggregation
+            stats = None
+            file_names = await client.list_sources(collection, limit=limit)
+        else:
+            stats = await client.get_collection_stats(
+                collection,
+                limit=limit,
+                fields=["file_names", "row_count", "mime_types"],
+            )
+            file_names = stats.get("file_names", [])
     except CollectionNotFoundError as exc:
         # Get available collections to help the agent
         try:
@@ -72,12 +86,10 @@ async def rag_list_sources(
     except VectorClientError as exc:
         raise ToolError(f"Failed to get sources: {exc}") from exc
 
-    file_names = stats.get("file_names", [])
-
     if not file_names:
         return f"No sources found in collection '{collection}'. Use the ingest pipeline to add documents."
 
-    # Apply limit
+    # Apply limit (defensive: older gateways ignore the limit param)
     file_names = file_names[:limit]
 
     if response_format == "concise":
@@ -91,10 +103,11 @@ async def rag_list_sources(
         output = {
             "collection": collection,
             "sources": [{"file_name": name} for name in file_names],
-            "total_sources": len(stats.get("file_names", [])),  # Total before limit
+            # Total before limit; gateways that trim report it separately
+            "total_sources": stats.get("total_file_names", len(stats.get("file_names", []))),
             "shown": len(file_names),
             "chunk_count": row_count,
             "file_types": mime_types,
         }
 
-        return json.dumps(output, indent=2)
+        return _json.dumps(output, indent=True)
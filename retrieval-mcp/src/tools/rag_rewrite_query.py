@@ -1,5 +1,9 @@
 """Rewrite a query for better retrieval using LLM sampling."""
 
+import functools
+import hashlib
+import time
+from collections import OrderedDict
 from typing import Annotated
 from pydantic import Field
 from fastmcp import Context
@@ -8,6 +12,40 @@ from fastmcp.exceptions import ToolError
 from core.app import mcp
 
 
+# Recent rewrites keyed by (query, domain_context, rewrite_style) digest.
+# Agent loops often re-rewrite the same query after inspecting results;
+# a hit skips a 100-1000ms LLM round-trip. Entries expire after
+# _REWRITE_CACHE_TTL seconds and the oldest are evicted past
+# _REWRITE_CACHE_MAX entries.
+_REWRITE_CACHE: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_REWRITE_CACHE_TTL = 300.0
+_REWRITE_CACHE_MAX = 1024
+
+
+def _cache_key(query: str, domain_context: str | None, rewrite_style: str) -> str:
+    raw = "\x00".join((query, domain_context or "", rewrite_style))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    entry = _REWRITE_CACHE.get(key)
+    if entry is None:
+        return None
+    rewritten, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _REWRITE_CACHE[key]
+        return None
+    _REWRITE_CACHE.move_to_end(key)
+    return rewritten
+
+
+def _cache_put(key: str, rewritten: str) -> None:
+    _REWRITE_CACHE[key] = (rewritten, time.monotonic() + _REWRITE_CACHE_TTL)
+    _REWRITE_CACHE.move_to_end(key)
+    while len(_REWRITE_CACHE) > _REWRITE_CACHE_MAX:
+        _REWRITE_CACHE.popitem(last=False)
+
+
 STYLE_INSTRUCTIONS = {
     "expand": "Add synonyms and related terms to broaden the search.",
     "simplify": "Clarify and simplify the query for direct matching.",
@@ -22,6 +60,21 @@ Rules:
 - Remove filler words
 - Output ONLY the rewritten query, nothing else"""
 
+# Prompt text is fixed per style, so specialize the templates once at
+# import; the tool body only substitutes the query.
+_STYLE_TEMPLATES = {
+    style: f"{instruction}\n\nOriginal query: $query\n\nRewritten query:"
+    for style, instruction in STYLE_INSTRUCTIONS.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _system_prompt(domain_context: str | None) -> str:
+    """System prompt, with the domain context folded in when provided."""
+    if domain_context:
+        return f"{SYSTEM_PROMPT}\n\nDomain context: {domain_context}"
+    return SYSTEM_PROMPT
+
 
 @mcp.tool(
     annotations={
@@ -60,11 +113,14 @@ async def rag_rewrite_query(
         -> "brake system malfunction troubleshooting brake pad inspection"
         -> rag_search(query="brake system malfunction...", collection="s1000d_bikes")
     """
-    # Validate inputs
-    if not query or not query.strip():
+    # Validate inputs (strip once, reuse below)
+    query = query.strip() if query else ""
+    if not query:
         raise ToolError("Query cannot be empty")
 
-    if rewrite_style not in STYLE_INSTRUCTIONS:
+    # One lookup both validates the style and fetches its template
+    template = _STYLE_TEMPLATES.get(rewrite_style)
+    if template is None:
         raise ToolError(
             f"rewrite_style must be one of: {', '.join(STYLE_INSTRUCTIONS.keys())}"
         )
@@ -75,18 +131,16 @@ async def rag_rewrite_query(
             "Query rewriting requires LLM sampling. Context not available - use rag_search directly."
         )
 
-    # Build system prompt with domain context if provided
-    system_prompt = SYSTEM_PROMPT
-    if domain_context:
-        system_prompt += f"\n\nDomain context: {domain_context}"
-
-    # Build the prompt
-    style_instruction = STYLE_INSTRUCTIONS[rewrite_style]
-    prompt = f"""{style_instruction}
-
-Original query: {query.strip()}
+    # Serve repeat rewrites from the cache without sampling
+    cache_key = _cache_key(query, domain_context, rewrite_style)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        await ctx.info(f"Rewrite cache hit: '{query}' -> '{cached}'")
+        return cached
 
-Rewritten query:"""
+    # Specialize the precompiled template and memoized system prompt
+    system_prompt = _system_prompt(domain_context)
+    prompt = template.replace("$query", query)
 
     # Request LLM to rewrite the query
     try:
@@ -102,9 +156,10 @@ Rewritten query:"""
         # Validate we got something back
         if not rewritten:
             await ctx.warning("LLM returned empty response, returning original query")
-            return query.strip()
+            return query
 
-        await ctx.info(f"Query rewritten: '{query.strip()}' -> '{rewritten}'")
+        _cache_put(cache_key, rewritten)
+        await ctx.info(f"Query rewritten: '{query}' -> '{rewritten}'")
         return rewritten
 
     except NotImplementedError as exc:
@@ -1,17 +1,67 @@
 """Search for relevant content in a document collection using hybrid search (dense + BM25) with reranking."""
 
-from typing import Annotated
-from pydantic import Field
+import asyncio
+from typing import Annotated, Literal
+from pydantic import BaseModel, Field, StringConstraints, ValidationError
 from fastmcp.exceptions import ToolError
 
 from core.app import mcp
 from lib.vector_client import (
-    VectorClient,
+    get_vector_client,
+    peek_collections,
     CollectionNotFoundError,
     ServiceUnavailableError,
     VectorClientError,
 )
-from lib.formatters import format_concise, format_detailed
+from lib.formatters import filter_by_score, format_concise, format_detailed
+from lib import search_cache
+
+
+def _swallow_task_result(task: asyncio.Task) -> None:
+    """Retrieve a speculative task's outcome so failures aren't logged."""
+    if not task.cancelled():
+        task.exception()
+
+
+_NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+class _SearchParams(BaseModel):
+    """Validated rag_search arguments.
+
+    One pass through pydantic-core replaces the previous chain of six
+    Python-level branch checks; string fields come back already stripped.
+    """
+
+    query: _NonEmptyStr
+    collection: _NonEmptyStr
+    top_k: int = Field(default=5, ge=1, le=20)
+    context_window: int = Field(default=2, ge=0, le=5)
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0)
+    response_format: Literal["concise", "detailed"] = "concise"
+
+
+# Help-message templates built once at import; the hot paths only pay
+# for the .format substitution
+_NO_HITS_TMPL = (
+    "No matching documents found in '{collection}'. "
+    "Try rag_rewrite_query to reformulate your query, "
+    "or use rag_list_sources to see available content."
+)
+_NOT_FOUND_TMPL = (
+    "Collection '{collection}' not found. Available collections: {available}. "
+    "Use rag_list_collections to see all."
+)
+
+# Stable, agent-friendly messages keyed by the field that failed
+_VALIDATION_MESSAGES = {
+    "query": "Query cannot be empty",
+    "collection": "Collection name is required. Check your system prompt for the collection to use.",
+    "top_k": "top_k must be between 1 and 20",
+    "context_window": "context_window must be between 0 and 5",
+    "min_score": "min_score must be between 0.0 and 1.0",
+    "response_format": "response_format must be 'concise' or 'detailed'",
+}
 
 
 @mcp.tool(
@@ -31,6 +81,7 @@ async def rag_search(
     mime_type: Annotated[str | None, Field(description="Filter by MIME type (e.g., 'application/pdf')")] = None,
     min_score: Annotated[float, Field(description="Minimum relevance threshold (0.0-1.0)")] = 0.0,
     response_format: Annotated[str, Field(description="Output format: 'concise' (text + citations) or 'detailed' (full metadata JSON)")] = "concise",
+    query_embedding: Annotated[list[float] | None, Field(description="Pre-computed query embedding; skips re-embedding the query on the gateway")] = None,
 ) -> str:
     """Search for relevant content in a document collection using hybrid search (dense + BM25) with reranking.
 
@@ -47,6 +98,7 @@ async def rag_search(
         mime_type: Filter by MIME type (e.g., 'application/pdf')
         min_score: Minimum relevance threshold (0.0-1.0)
         response_format: Output format: 'concise' (text + citations) or 'detailed' (full metadata JSON)
+        query_embedding: Pre-computed query embedding; skips re-embedding the query on the gateway
 
     Returns:
         Formatted search results (concise citations or detailed JSON)
@@ -54,66 +106,106 @@ async def rag_search(
     Raises:
         ToolError: If validation fails or operation cannot be completed
     """
-    # Validate inputs
-    if not query or not query.strip():
-        raise ToolError("Query cannot be empty")
-
-    if not collection or not collection.strip():
-        raise ToolError("Collection name is required. Check your system prompt for the collection to use.")
-
-    if top_k < 1 or top_k > 20:
-        raise ToolError("top_k must be between 1 and 20")
-
-    if context_window < 0 or context_window > 5:
-        raise ToolError("context_window must be between 0 and 5")
+    # Validate inputs in one compiled pass
+    try:
+        params = _SearchParams(
+            query=query,
+            collection=collection,
+            top_k=top_k,
+            context_window=context_window,
+            min_score=min_score,
+            response_format=response_format,
+        )
+    except ValidationError as exc:
+        errors = exc.errors()
+        field = errors[0]["loc"][0] if errors and errors[0]["loc"] else ""
+        raise ToolError(_VALIDATION_MESSAGES.get(field, str(exc))) from exc
+    query = params.query
+    collection = params.collection
+
+    # Serve repeat queries from the cache when enabled (RAG_SEMANTIC_CACHE=1).
+    # Skipped for caller-supplied embeddings: the result then depends on
+    # the vector, not the query text the key is built from.
+    cache_key = None
+    if search_cache.enabled() and query_embedding is None:
+        cache_key = search_cache.make_key(
+            query, collection, top_k, context_window,
+            file_name, file_pattern, mime_type, min_score,
+        )
+        cached = search_cache.cache.get(cache_key)
+        if cached is not None:
+            return _format_result(cached, collection, min_score, response_format)
 
-    if min_score < 0.0 or min_score > 1.0:
-        raise ToolError("min_score must be between 0.0 and 1.0")
+    # Call vector gateway
+    client = await get_vector_client()
 
-    if response_format not in ("concise", "detailed"):
-        raise ToolError("response_format must be 'concise' or 'detailed'")
+    # Fail fast when the cached collection list already rules this one out
+    known = peek_collections()
+    if known is not None and collection not in known:
+        available_str = ", ".join(known) if known else "none"
+        raise ToolError(
+            _NOT_FOUND_TMPL.format(collection=collection, available=available_str)
+        )
 
-    # Call vector gateway
-    client = VectorClient()
+    # On a cold cache, speculatively fetch the collection list in
+    # parallel so the not-found help message doesn't cost an extra RTT
+    # (this also warms the cache for subsequent calls)
+    list_task = None
+    if known is None:
+        list_task = asyncio.create_task(client.cached_list_collections())
+        list_task.add_done_callback(_swallow_task_result)
     try:
         result = await client.search(
-            query=query.strip(),
-            collection=collection.strip(),
+            query=query,
+            collection=collection,
             top_k=top_k,
             context_window=context_window,
             file_name=file_name,
             file_pattern=file_pattern,
             mime_type=mime_type,
+            min_score=min_score,
+            query_embedding=query_embedding,
         )
     except CollectionNotFoundError as exc:
-        # Get available collections to help the agent
+        # Get available collections to help the agent (cache went stale
+        # if it previously confirmed this collection)
         try:
-            available = await client.list_collections()
+            if list_task is not None:
+                available = await list_task
+            else:
+                available = await client.list_collections()
             available_str = ", ".join(available) if available else "none"
         except Exception:
             # If we can't list collections, just use the original error
             raise ToolError(str(exc)) from exc
         raise ToolError(
-            f"Collection '{collection}' not found. Available collections: {available_str}. "
-            "Use rag_list_collections to see all."
+            _NOT_FOUND_TMPL.format(collection=collection, available=available_str)
         ) from exc
     except ServiceUnavailableError as exc:
         raise ToolError(str(exc)) from exc
     except VectorClientError as exc:
         raise ToolError(f"Search failed: {exc}") from exc
+    finally:
+        if list_task is not None and not list_task.done():
+            list_task.cancel()
+
+    if cache_key is not None:
+        search_cache.cache.put(cache_key, result)
+
+    return _format_result(result, collection, min_score, response_format)
 
-    # Extract hits and apply min_score filter
-    hits = result.get("hits", [])
-    if min_score > 0.0:
-        hits = [h for h in hits if h.get("score", 0.0) >= min_score]
+
+def _format_result(
+    result: dict, collection: str, min_score: float, response_format: str
+) -> str:
+    """Filter and format a raw gateway search response."""
+    # min_score is enforced gateway-side before serialization; this
+    # re-check is a safety net for older gateways that ignore the field
+    hits = filter_by_score(result.get("hits", []), min_score)
 
     # Handle no results
     if not hits:
-        return (
-            f"No matching documents found in '{collection}'. "
-            "Try rag_rewrite_query to reformulate your query, "
-            "or use rag_list_sources to see available content."
-        )
+        return _NO_HITS_TMPL.format(collection=collection)
 
     # Format response
     latency_ms = result.get("latency_ms", 0)
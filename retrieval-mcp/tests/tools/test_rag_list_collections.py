@@ -13,7 +13,7 @@ rag_list_collections_fn = rag_list_collections.fn
 @pytest.mark.asyncio
 async def test_rag_list_collections_concise():
     """Test listing collections in concise format."""
-    with patch("tools.rag_list_collections.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_collections.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.list_collections.return_value = [
             "s1000d_bikes",
@@ -32,7 +32,7 @@ async def test_rag_list_collections_concise():
 @pytest.mark.asyncio
 async def test_rag_list_collections_detailed():
     """Test listing collections with detailed stats."""
-    with patch("tools.rag_list_collections.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_collections.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.list_collections.return_value = ["s1000d_bikes", "product_manuals"]
         mock_client.get_collection_stats.side_effect = [
@@ -69,7 +69,7 @@ async def test_rag_list_collections_detailed():
 @pytest.mark.asyncio
 async def test_rag_list_collections_empty():
     """Test when no collections exist."""
-    with patch("tools.rag_list_collections.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_collections.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.list_collections.return_value = []
         mock_client_class.return_value = mock_client
@@ -91,7 +91,7 @@ async def test_rag_list_collections_service_unavailable():
     """Test handling service unavailability."""
     from lib.vector_client import ServiceUnavailableError
 
-    with patch("tools.rag_list_collections.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_collections.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.list_collections.side_effect = ServiceUnavailableError(
             "Vector gateway temporarily unavailable"
@@ -105,7 +105,7 @@ async def test_rag_list_collections_service_unavailable():
 @pytest.mark.asyncio
 async def test_rag_list_collections_detailed_stats_error():
     """Test that detailed format handles stats errors gracefully."""
-    with patch("tools.rag_list_collections.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_collections.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.list_collections.return_value = ["collection_a", "collection_b"]
         # First call succeeds, second fails
@@ -25,9 +25,9 @@ MOCK_COLLECTION_STATS = {
 @pytest.mark.asyncio
 async def test_rag_list_sources_concise():
     """Test listing sources in concise format."""
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client.get_collection_stats.return_value = MOCK_COLLECTION_STATS
+        mock_client.list_sources.return_value = MOCK_COLLECTION_STATS["file_names"]
         mock_client_class.return_value = mock_client
 
         result = await rag_list_sources_fn(collection="s1000d_bikes")
@@ -43,7 +43,7 @@ async def test_rag_list_sources_concise():
 @pytest.mark.asyncio
 async def test_rag_list_sources_detailed():
     """Test listing sources with detailed stats."""
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.get_collection_stats.return_value = MOCK_COLLECTION_STATS
         mock_client_class.return_value = mock_client
@@ -64,7 +64,7 @@ async def test_rag_list_sources_detailed():
 @pytest.mark.asyncio
 async def test_rag_list_sources_with_limit():
     """Test that limit restricts number of sources returned."""
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.get_collection_stats.return_value = {
             "file_names": [f"doc{i}.pdf" for i in range(100)],
@@ -88,13 +88,9 @@ async def test_rag_list_sources_with_limit():
 @pytest.mark.asyncio
 async def test_rag_list_sources_empty_collection():
     """Test when collection has no sources."""
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client.get_collection_stats.return_value = {
-            "file_names": [],
-            "row_count": 0,
-            "mime_types": [],
-        }
+        mock_client.list_sources.return_value = []
         mock_client_class.return_value = mock_client
 
         result = await rag_list_sources_fn(collection="empty_collection")
@@ -134,9 +130,9 @@ async def test_rag_list_sources_collection_not_found():
     """Test handling collection not found with helpful message."""
     from lib.vector_client import CollectionNotFoundError
 
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client.get_collection_stats.side_effect = CollectionNotFoundError("Not found")
+        mock_client.list_sources.side_effect = CollectionNotFoundError("Not found")
         mock_client.list_collections.return_value = ["collection_a", "collection_b"]
         mock_client_class.return_value = mock_client
 
@@ -152,9 +148,9 @@ async def test_rag_list_sources_service_unavailable():
     """Test handling service unavailability."""
     from lib.vector_client import ServiceUnavailableError
 
-    with patch("tools.rag_list_sources.VectorClient") as mock_client_class:
+    with patch("tools.rag_list_sources.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client.get_collection_stats.side_effect = ServiceUnavailableError(
+        mock_client.list_sources.side_effect = ServiceUnavailableError(
             "Vector gateway temporarily unavailable"
         )
         mock_client_class.return_value = mock_client
@@ -52,7 +52,7 @@ MOCK_SEARCH_RESPONSE = {
 @pytest.mark.asyncio
 async def test_rag_search_basic():
     """Test basic rag_search functionality with concise format."""
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.return_value = MOCK_SEARCH_RESPONSE
         mock_client_class.return_value = mock_client
@@ -80,7 +80,7 @@ async def test_rag_search_basic():
 @pytest.mark.asyncio
 async def test_rag_search_detailed_format():
     """Test rag_search with detailed JSON format."""
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.return_value = MOCK_SEARCH_RESPONSE
         mock_client_class.return_value = mock_client
@@ -104,7 +104,7 @@ async def test_rag_search_detailed_format():
 @pytest.mark.asyncio
 async def test_rag_search_with_filters():
     """Test rag_search with metadata filters."""
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.return_value = MOCK_SEARCH_RESPONSE
         mock_client_class.return_value = mock_client
@@ -124,7 +124,7 @@ async def test_rag_search_with_filters():
 @pytest.mark.asyncio
 async def test_rag_search_min_score_filter():
     """Test that min_score filters out low-scoring results."""
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.return_value = MOCK_SEARCH_RESPONSE
         mock_client_class.return_value = mock_client
@@ -145,7 +145,7 @@ async def test_rag_search_min_score_filter():
 @pytest.mark.asyncio
 async def test_rag_search_no_results():
     """Test rag_search when no results are found."""
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.return_value = {"hits": [], "count": 0, "latency_ms": 50}
         mock_client_class.return_value = mock_client
@@ -218,7 +218,7 @@ async def test_rag_search_service_unavailable():
     """Test rag_search handles service unavailability."""
     from lib.vector_client import ServiceUnavailableError
 
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.side_effect = ServiceUnavailableError("Service down")
         mock_client_class.return_value = mock_client
@@ -232,10 +232,10 @@ async def test_rag_search_collection_not_found():
     """Test rag_search handles collection not found with helpful message."""
     from lib.vector_client import CollectionNotFoundError
 
-    with patch("tools.rag_search.VectorClient") as mock_client_class:
+    with patch("tools.rag_search.get_vector_client") as mock_client_class:
         mock_client = AsyncMock()
         mock_client.search.side_effect = CollectionNotFoundError("Not found")
-        mock_client.list_collections.return_value = ["collection_a", "collection_b"]
+        mock_client.cached_list_collections.return_value = ["collection_a", "collection_b"]
         mock_client_class.return_value = mock_client
 
         with pytest.raises(ToolError) as exc_info:
@@ -1,54 +1,114 @@
 """Embedding Service - FastAPI microservice for generating text embeddings."""
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
 import os
+import struct
 import time
-from typing import Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, List, Optional, Union
 
-from fastapi import Depends, FastAPI, Header, HTTPException
-from pydantic import BaseModel, Field, validator
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
 
 # Import from rag_core shared library
-from rag_core import embed_texts, get_embedding_model
+from rag_core import embed_texts, get_embedding_config, get_embedding_model
+# Async OpenAI-compatible path with concurrent sub-batch dispatch
+from lib.config import aclose_async_clients
+from lib.embed import embed_texts as embed_texts_async
 
 
 AUTH_TOKEN = os.environ.get("AUTH_TOKEN")
 MAX_BATCH = int(os.environ.get("EMBEDDING_MAX_BATCH", "64"))
-logging.basicConfig(level=logging.INFO)
+MAX_BODY_BYTES = int(os.environ.get("EMBEDDING_MAX_BODY_BYTES", str(16 * 1024 * 1024)))
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger("embedding_service")
-app = FastAPI(title="Embedding Service", version="0.1.0")
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Liveness probes hit /healthz every few seconds; build the body
+    # once instead of re-resolving env vars per probe.
+    app.state.health = {"status": "ok", "model": get_embedding_model(), "max_batch": MAX_BATCH}
+    yield
+    # Close the shared httpx pool with the loop still running so keepalive
+    # connections shut down gracefully; a new loop rebuilds fresh clients
+    await aclose_async_clients()
+
+
+app = FastAPI(
+    title="Embedding Service",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+
+
+@app.middleware("http")
+async def _reject_oversized_body(request: Request, call_next):
+    """Return 413 from the declared Content-Length, before body parsing.
+
+    An oversized batch otherwise costs a full JSON parse and Pydantic
+    materialization just to be rejected by the batch-size check.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        return ORJSONResponse(
+            status_code=413,
+            content={"detail": f"request body too large; max {MAX_BODY_BYTES} bytes"},
+        )
+    return await call_next(request)
 
 
 class EmbedRequest(BaseModel):
     texts: List[str] = Field(..., description="List of texts to embed")
     model: Optional[str] = Field(default=None, description="Override embedding model")
-    encoding_format: Optional[str] = Field(default=None, description="Embedding encoding format (float/base64)")
+    encoding_format: Optional[str] = Field(default=None, description="Embedding encoding format (float/base64/fp16)")
 
-    @validator("texts")
+    @field_validator("texts")
+    @classmethod
     def _validate_texts(cls, v: List[str]) -> List[str]:
         if not v:
             raise ValueError("texts must be non-empty")
+        if len(v) > MAX_BATCH:
+            # Abort inside validation so the request fails as soon as
+            # the list is built, not after the whole model materializes
+            raise ValueError(f"batch too large; max {MAX_BATCH}")
         return v
 
-    @validator("encoding_format")
+    @field_validator("encoding_format")
+    @classmethod
     def _validate_encoding_format(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        allowed = {"float", "base64"}
+        allowed = {"float", "base64", "fp16"}
         if v not in allowed:
             raise ValueError(f"encoding_format must be one of {sorted(allowed)}")
         return v
 
 
 class EmbedResponse(BaseModel):
-    vectors: List[List[float]]
+    # Each vector is a float list, or a base64 string for the
+    # base64 (fp32, upstream passthrough) / fp16 encoding formats
+    vectors: List[Union[List[float], str]]
     model: str
     dimensions: int
     count: int
     latency_ms: int
 
 
+def _to_fp16_b64(vector: List[float]) -> str:
+    """Pack a float vector as little-endian fp16 and base64 it.
+
+    Halves the bytes of base64 fp32 and skips JSON float formatting
+    entirely; consumers decode straight into a float16 buffer.
+    """
+    return base64.b64encode(struct.pack(f"<{len(vector)}e", *vector)).decode("ascii")
+
+
 def _auth_dependency(authorization: str = Header(None), x_api_key: str = Header(None)) -> None:
     if not AUTH_TOKEN:
         return
@@ -62,32 +122,65 @@ def _auth_dependency(authorization: str = Header(None), x_api_key: str = Header(
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, Any]:
-    return {"status": "ok", "model": get_embedding_model(), "max_batch": MAX_BATCH}
+async def healthz() -> dict[str, Any]:
+    return app.state.health
 
 
-@app.post("/embed", response_model=EmbedResponse)
-def embed(request: EmbedRequest, _: None = Depends(_auth_dependency)) -> EmbedResponse:
-    if len(request.texts) > MAX_BATCH:
-        raise HTTPException(status_code=400, detail=f"batch too large; max {MAX_BATCH}")
+def _use_local_async() -> bool:
+    """Whether the async OpenAI-compatible path can serve this config.
 
+    The local lib resolves credentials from the standard env vars; only
+    take the fast path when the rag_core config agrees on provider type
+    and base URL, so caikit/cohere and YAML-customized setups keep going
+    through rag_core unchanged.
+    """
+    try:
+        cfg = get_embedding_config()
+    except Exception:
+        return False
+    if cfg.type not in ("openai-compatible", "openai"):
+        return False
+    env_base = os.environ.get("EMBEDDING_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
+    return (cfg.base_url or None) == (env_base or None)
+
+
+@app.post("/embed", response_model=EmbedResponse)
+async def embed(request: EmbedRequest, _: None = Depends(_auth_dependency)) -> EmbedResponse:
     start = time.time()
+    # fp16 is our own wire format: fetch floats upstream, cast below
+    upstream_format = None if request.encoding_format == "fp16" else request.encoding_format
     try:
-        # prefer_service=False to avoid circular calls (we ARE the service)
-        vectors = embed_texts(
-            request.texts,
-            model=request.model,
-            encoding_format=request.encoding_format,
-            prefer_service=False,
-        )
+        if _use_local_async():
+            # Sub-batches of a large request are dispatched concurrently
+            vectors = await embed_texts_async(
+                request.texts,
+                model=request.model or get_embedding_model(),
+                encoding_format=upstream_format,
+            )
+        else:
+            # Non-OpenAI providers: keep the sync rag_core path, off the
+            # event loop. prefer_service=False to avoid circular calls
+            # (we ARE the service)
+            vectors = await asyncio.to_thread(
+                embed_texts,
+                request.texts,
+                model=request.model,
+                encoding_format=upstream_format,
+                prefer_service=False,
+            )
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover - defensive guard
         raise HTTPException(status_code=500, detail=str(exc))
 
+    # base64 passthrough returns strings; dims are only known for floats
+    dims = len(vectors[0]) if vectors and isinstance(vectors[0], list) else 0
+    if request.encoding_format == "fp16":
+        vectors = [_to_fp16_b64(v) for v in vectors]
+
     latency_ms = int((time.time() - start) * 1000)
-    dims = len(vectors[0]) if vectors else 0
-    response = EmbedResponse(
+    # model_construct: fields are trusted locals, skip re-validation
+    response = EmbedResponse.model_construct(
         vectors=vectors,
         model=request.model or get_embedding_model(),
         dimensions=dims,
@@ -1,18 +1,70 @@
 """Configuration utilities for embedding service."""
 from __future__ import annotations
 
+import functools
 import os
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
+# HTTP/2 needs the h2 extra (httpx[http2]); fall back to HTTP/1.1 when
+# only plain httpx is installed.
+try:
+    import h2  # noqa: F401
 
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    _HTTP2 = False
+
+
+# One pool shared across all AsyncOpenAI instances: the SDK default is a
+# small HTTP/1.1 pool, which serializes the concurrent sub-batch gather
+# in lib.embed over too few connections. With h2 installed, requests
+# multiplex over a single keepalive connection instead.
+@functools.lru_cache(maxsize=1)
+def _shared_async_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=100, keepalive_expiry=60
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+# Memoized on (api_key, base_url): the OpenAI client owns an httpx pool,
+# so reusing it keeps connections warm instead of paying a TLS handshake
+# per request. Env vars are still read per call by the public getters.
+@functools.lru_cache(maxsize=4)
 def _build_client(api_key: str, base_url: Optional[str]) -> OpenAI:
     if base_url:
         return OpenAI(api_key=api_key, base_url=base_url)
     return OpenAI(api_key=api_key)
 
 
+@functools.lru_cache(maxsize=4)
+def _build_async_client(api_key: str, base_url: Optional[str]) -> AsyncOpenAI:
+    http_client = _shared_async_http_client()
+    if base_url:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+async def aclose_async_clients() -> None:
+    """Dispose the shared pool and cached async clients.
+
+    httpx connections are bound to the event loop they were opened on,
+    so a worker shutting down (or a test tearing down its loop) must not
+    leave cached clients behind for the next loop. Called from the app's
+    lifespan shutdown; the caches rebuild lazily on next use.
+    """
+    if _shared_async_http_client.cache_info().currsize:
+        await _shared_async_http_client().aclose()
+    _shared_async_http_client.cache_clear()
+    _build_async_client.cache_clear()
+
+
 def get_embedding_model() -> str:
     return os.environ.get("EMBEDDING_MODEL", os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"))
 
@@ -23,3 +75,11 @@ def get_embedding_client() -> OpenAI:
         raise RuntimeError("EMBEDDING_API_KEY or OPENAI_API_KEY must be set for embeddings")
     base_url: Optional[str] = os.environ.get("EMBEDDING_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
     return _build_client(api_key, base_url)
+
+
+def get_async_embedding_client() -> AsyncOpenAI:
+    api_key = os.environ.get("EMBEDDING_API_KEY") or os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("EMBEDDING_API_KEY or OPENAI_API_KEY must be set for embeddings")
+    base_url: Optional[str] = os.environ.get("EMBEDDING_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
+    return _build_async_client(api_key, base_url)
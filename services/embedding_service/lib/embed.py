@@ -1,52 +1,87 @@
 """Core embedding functionality for embedding service."""
 from __future__ import annotations
 
+import asyncio
 from typing import Iterable, List, Optional
 
-from .config import get_embedding_client, get_embedding_model
-from .token_utils import estimate_tokens
+from openai import AsyncOpenAI
 
+from .config import get_async_embedding_client, get_embedding_model
+from .token_utils import estimate_tokens, truncate_to_tokens
 
-def embed_texts(
+# OpenAI embeddings accept at most this many inputs per request
+MAX_BATCH_ITEMS = 2048
+
+
+async def embed_texts(
     texts: Iterable[str],
     model: Optional[str] = None,
     encoding_format: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None,
 ) -> List[List[float]]:
-    """Generate embeddings for a list of texts using OpenAI API."""
-    clean_texts = [t if t is not None else "" for t in texts]
-    if not clean_texts:
-        return []
-
-    client = get_embedding_client()
-    chosen_model = model or get_embedding_model()
+    """Generate embeddings for a list of texts using OpenAI API.
 
+    Token-budgeted batches are built first, then dispatched concurrently:
+    the path is network-bound, so the sub-batches of a large request
+    overlap instead of queueing behind each other.
+    """
     max_tokens_per_batch = 3500
     max_input_tokens = 7500
-    vectors: List[List[float]] = []
-    batch: List[str] = []
-    current_tokens = 0
 
-    for text in clean_texts:
+    # Pass 1: normalize None -> "", estimate, and truncate in one sweep,
+    # keeping original positions; no separate cleaned copy of the input
+    entries: List[tuple[int, str, int]] = []
+    for i, text in enumerate(texts):
+        if text is None:
+            text = ""
         est = estimate_tokens(text)
         if est > max_input_tokens:
-            # Truncate proportionally to stay under the per-input limit.
-            keep_ratio = max_input_tokens / est
-            text = text[: max(1, int(len(text) * keep_ratio))]
-            est = estimate_tokens(text)
-        if batch and current_tokens + est > max_tokens_per_batch:
-            response = client.embeddings.create(
-                model=chosen_model, input=batch, **({"encoding_format": encoding_format} if encoding_format else {})
+            # Token-accurate slice: guaranteed to fit the per-input
+            # limit, so no re-estimate and no upstream 400 on overflow
+            text = truncate_to_tokens(text, max_input_tokens)
+            est = max_input_tokens
+        entries.append((i, text, est))
+
+    if not entries:
+        return []
+
+    # Callers (tests, alternative apps) may inject their own client;
+    # the default is the process-wide cached one
+    if client is None:
+        client = get_async_embedding_client()
+    chosen_model = model or get_embedding_model()
+
+    # Pass 2: first-fit-decreasing pack under both the token budget and
+    # OpenAI's per-request item cap; fewer, fuller batches than flushing
+    # at the first overflow
+    entries.sort(key=lambda e: e[2], reverse=True)
+    batches: List[List[tuple[int, str]]] = []
+    batch_tokens: List[int] = []
+    for i, text, est in entries:
+        for b, used in enumerate(batch_tokens):
+            if used + est <= max_tokens_per_batch and len(batches[b]) < MAX_BATCH_ITEMS:
+                batches[b].append((i, text))
+                batch_tokens[b] = used + est
+                break
+        else:
+            batches.append([(i, text)])
+            batch_tokens.append(est)
+
+    # Pass 3: fan the API calls out and scatter vectors back into input
+    # order via the tracked indices
+    extra = {"encoding_format": encoding_format} if encoding_format else {}
+    responses = await asyncio.gather(
+        *(
+            client.embeddings.create(
+                model=chosen_model, input=[text for _, text in b], **extra
             )
-            vectors.extend([item.embedding for item in response.data])
-            batch = []
-            current_tokens = 0
-        batch.append(text)
-        current_tokens += est
-
-    if batch:
-        response = client.embeddings.create(
-            model=chosen_model, input=batch, **({"encoding_format": encoding_format} if encoding_format else {})
+            for b in batches
         )
-        vectors.extend([item.embedding for item in response.data])
+    )
+
+    vectors: List[List[float]] = [[] for _ in entries]
+    for b, response in zip(batches, responses):
+        for (i, _), item in zip(b, response.data):
+            vectors[i] = item.embedding
 
     return vectors
@@ -6,13 +6,47 @@ a simple heuristic of ~4 characters per token.
 """
 from __future__ import annotations
 
+import functools
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:  # pragma: no cover - depends on installed extras
+    tiktoken = None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str):
+    """Memoized encoder lookup; loading the BPE tables is expensive."""
+    return tiktoken.get_encoding(encoding_name)
+
 
 def estimate_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
-    try:
-        import tiktoken  # type: ignore
-
-        enc = tiktoken.get_encoding(encoding_name)
-        return len(enc.encode(text))
-    except Exception:
-        # Heuristic: average 4 characters per token for English-ish text.
-        return max(1, len(text) // 4)
+    if tiktoken is not None:
+        try:
+            # encode_ordinary skips the special-token scan; these are
+            # user texts, not prompts with control tokens
+            return len(_get_encoding(encoding_name).encode_ordinary(text))
+        except Exception:
+            pass
+    # Heuristic: average 4 characters per token for English-ish text.
+    return max(1, len(text) // 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, encoding_name: str = "cl100k_base") -> str:
+    """Truncate text to at most max_tokens, slicing on the token array.
+
+    Character-proportional truncation misjudges code-heavy or non-English
+    text, where the char/token ratio varies widely; slicing the encoded
+    ids guarantees the result fits the budget.
+    """
+    if tiktoken is not None:
+        try:
+            enc = _get_encoding(encoding_name)
+            ids = enc.encode_ordinary(text)
+            if len(ids) <= max_tokens:
+                return text
+            return enc.decode(ids[:max_tokens])
+        except Exception:
+            pass
+    # Heuristic: average 4 characters per token for English-ish text.
+    return text[: max(1, max_tokens * 4)]
@@ -4,19 +4,36 @@ from __future__ import annotations
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
 
 from lib.evaluate import evaluate_answer
 from lib.config import get_eval_model
 
 
 AUTH_TOKEN = os.environ.get("AUTH_TOKEN")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger("evaluator_service")
-app = FastAPI(title="Evaluator Service", version="0.1.0")
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Liveness probes hit /healthz every few seconds; build the body
+    # once instead of re-resolving env vars per probe.
+    app.state.health = {"status": "ok", "model": get_eval_model()}
+    yield
+
+
+app = FastAPI(
+    title="Evaluator Service",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
 
 
 class EvalRequest(BaseModel):
@@ -25,7 +42,8 @@ class EvalRequest(BaseModel):
     plan: Dict[str, Any] = Field(default_factory=dict)
     keywords: List[str] = Field(default_factory=list)
 
-    @validator("keywords", pre=True)
+    @field_validator("keywords", mode="before")
+    @classmethod
     def _normalize_keywords(cls, v):
         if v is None:
             return []
@@ -54,8 +72,8 @@ def _auth_dependency(authorization: str = Header(None), x_api_key: str = Header(
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, Any]:
-    return {"status": "ok", "model": get_eval_model()}
+async def healthz() -> dict[str, Any]:
+    return app.state.health
 
 
 @app.post("/evaluate", response_model=EvalResponse)
@@ -2,60 +2,123 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 from .config import get_openai_client, get_eval_model
 
+# Prompt skeleton built once at import; per-call work is just the
+# concatenation of the keyword hint and the question/answer/plan tail.
+_PROMPT_PREAMBLE = """You are grading a RAG answer. Score groundedness and completeness from 0 to 1.
+- Every sentence must include a citation like [s1]; missing citations or unverifiable claims should pull the score below 0.5.
+- If the question requests a timeframe/interval (e.g., screening cadence), the answer must state that interval with a citation or score <= 0.6.
+- Key terms to verify in cited spans: """
+
+_PROMPT_FORMAT = """
+- Keep feedback short (one or two sentences).
+- suggested_plan should tweak only window_size, overlap, or mode and be null if the current plan seems fine.
+Return ONLY valid JSON (no prose) with keys:
+{
+  "score": <number between 0 and 1 for groundedness/completeness>,
+  "feedback": "<short string>",
+  "suggested_plan": {
+    "window_size": <int>,
+    "overlap": <int>,
+    "mode": "<tokens|lines|chars>"
+  } | null
+}
+"""
+
+# Compiled once: [s1]-style citation marker, the same shape the grading
+# prompt demands of every sentence.
+_CITATION_RE = re.compile(r"\[s\d+\]")
+
+# Reasoning models reject the temperature kwarg; without a cache every
+# request against them pays a failed round-trip before the retry. The
+# prefix list answers for known families up front, the dict remembers
+# what we learned about everything else.
+_NO_TEMPERATURE_PREFIXES = ("o1", "o3", "gpt-5")
+_SUPPORTS_TEMPERATURE: Dict[str, bool] = {}
+
+
+def _model_supports_temperature(model: str) -> bool:
+    cached = _SUPPORTS_TEMPERATURE.get(model)
+    if cached is not None:
+        return cached
+    return not model.startswith(_NO_TEMPERATURE_PREFIXES)
+
+
+def _precheck_answer(question: str, answer: str, keywords: List[str]) -> Optional[str]:
+    """Deterministic rejection before the LLM round-trip.
+
+    Answers the model would certainly score below 0.5 — empty, missing
+    any citation, or mentioning none of the required key terms — don't
+    need a judgment call. Returns the feedback string for a rejected
+    answer, or None to proceed to the model.
+    """
+    if not question.strip():
+        return "Empty question"
+    if not answer.strip():
+        return "Empty answer"
+    if not _CITATION_RE.search(answer):
+        return "No citations found"
+    if keywords:
+        answer_lower = answer.lower()
+        if not any(k.lower() in answer_lower for k in keywords):
+            return "Answer mentions none of the key terms to verify"
+    return None
+
 
 def evaluate_answer(
     question: str, answer: str, plan: Dict[str, Any], keywords: List[str]
 ) -> Dict[str, Any]:
     """Score an answer for groundedness/completeness and suggest plan tweaks."""
 
+    model = get_eval_model()
+    feedback = _precheck_answer(question, answer, keywords)
+    if feedback is not None:
+        return {
+            "score": 0.2,
+            "feedback": feedback,
+            "suggested_plan": None,
+            "model": model,
+            "_raw_eval": None,
+        }
+
     keyword_hint = ", ".join(keywords) if keywords else "none specified"
     prompt = {
         "role": "user",
         "content": [
             {
                 "type": "text",
-                "text": f"""You are grading a RAG answer. Score groundedness and completeness from 0 to 1.
-- Every sentence must include a citation like [s1]; missing citations or unverifiable claims should pull the score below 0.5.
-- If the question requests a timeframe/interval (e.g., screening cadence), the answer must state that interval with a citation or score <= 0.6.
-- Key terms to verify in cited spans: {keyword_hint}
-- Keep feedback short (one or two sentences).
-- suggested_plan should tweak only window_size, overlap, or mode and be null if the current plan seems fine.
-Return ONLY valid JSON (no prose) with keys:
-{{
-  "score": <number between 0 and 1 for groundedness/completeness>,
-  "feedback": "<short string>",
-  "suggested_plan": {{
-    "window_size": <int>,
-    "overlap": <int>,
-    "mode": "<tokens|lines|chars>"
-  }} | null
-}}
-
-Question: {question}
-Answer: {answer}
-Current plan: {json.dumps(plan)}
-""",
+                "text": _PROMPT_PREAMBLE
+                + keyword_hint
+                + _PROMPT_FORMAT
+                + f"\nQuestion: {question}\nAnswer: {answer}\nCurrent plan: {orjson.dumps(plan).decode()}\n",
             }
         ],
     }
 
     client = get_openai_client()
-    model = get_eval_model()
 
     kwargs: Dict[str, Any] = {
         "model": model,
         "messages": [prompt],
         "response_format": {"type": "json_object"},
     }
-    try:
-        kwargs["temperature"] = 0.0
-        resp = client.chat.completions.create(**kwargs)
-    except Exception:
-        kwargs.pop("temperature", None)
+    if _model_supports_temperature(model):
+        try:
+            resp = client.chat.completions.create(temperature=0.0, **kwargs)
+            _SUPPORTS_TEMPERATURE[model] = True
+        except Exception as exc:
+            # Only a 400 proves the model rejects the kwarg; transient
+            # failures must not poison the cache.
+            if getattr(exc, "status_code", None) == 400:
+                _SUPPORTS_TEMPERATURE[model] = False
+            resp = client.chat.completions.create(**kwargs)
+    else:
         resp = client.chat.completions.create(**kwargs)
 
     raw = resp.choices[0].message.content
@@ -4,9 +4,11 @@ from __future__ import annotations
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from lib.plan import ask_llm_for_plan
@@ -14,9 +16,24 @@ from lib.config import get_plan_model
 
 
 AUTH_TOKEN = os.environ.get("AUTH_TOKEN")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger("plan_service")
-app = FastAPI(title="Plan Service", version="0.1.0")
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Liveness probes hit /healthz every few seconds; build the body
+    # once instead of re-resolving env vars per probe.
+    app.state.health = {"status": "ok", "model": get_plan_model()}
+    yield
+
+
+app = FastAPI(
+    title="Plan Service",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
 
 
 class PlanRequest(BaseModel):
@@ -46,8 +63,8 @@ def _auth_dependency(authorization: str = Header(None), x_api_key: str = Header(
 
 
 @app.get("/healthz")
-def healthz() -> Dict[str, Any]:
-    return {"status": "ok", "model": get_plan_model()}
+async def healthz() -> Dict[str, Any]:
+    return app.state.health
 
 
 @app.post("/plan", response_model=PlanResponse)
@@ -1,12 +1,17 @@
 """Configuration utilities for plan service."""
 from __future__ import annotations
 
+import functools
 import os
 from typing import Optional
 
 from openai import OpenAI
 
 
+# Memoized on (api_key, base_url): the OpenAI client owns an httpx pool,
+# so reusing it keeps connections warm instead of paying a TLS handshake
+# per request. Env vars are still read per call by the public getter.
+@functools.lru_cache(maxsize=4)
 def _build_client(api_key: str, base_url: Optional[str]) -> OpenAI:
     if base_url:
         return OpenAI(api_key=api_key, base_url=base_url)
@@ -4,28 +4,20 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
-from .config import get_openai_plan_client, get_plan_model
-
-
-def build_chunking_prompt(text: str, metadata: Dict[str, Any]) -> str:
-    """Build a prompt for asking an LLM to design a chunking plan.
-
-    The response is expected to be a JSON object containing the
-    ChunkingPlan fields. Validation of the result should be handled by
-    the caller.
-    """
+import orjson
 
-    max_chars = 15000
-    sample = text[:max_chars]
+from .config import get_openai_plan_client, get_plan_model
+from .token_utils import truncate_to_tokens
 
-    return f"""
+# Prompt skeleton built once at import; per-call work is just the
+# metadata dump and document sample spliced between the constants.
+_PROMPT_HEADER = """
 You are designing a chunking strategy for retrieval-augmented generation (RAG).
 
 Document metadata:
-{json.dumps(metadata, indent=2)}
+"""
 
-Document sample (may be truncated):
-\"\"\"{sample}\"\"\"
+_PROMPT_FIELDS = """\"\"\"
 
 Return ONLY a JSON object with these fields:
 
@@ -37,20 +29,57 @@ Return ONLY a JSON object with these fields:
 - notes: short string
 
 Example:
-{{
+{
   "window_size": 200,
   "overlap": 40,
   "mode": "tokens",
   "break_on_headings": true,
   "max_chunks": null,
   "notes": "Use headings to avoid splitting sections."
-}}
+}
 """
 
 
+def build_chunking_prompt(text: str, metadata: Dict[str, Any]) -> str:
+    """Build a prompt for asking an LLM to design a chunking plan.
+
+    The response is expected to be a JSON object containing the
+    ChunkingPlan fields. Validation of the result should be handled by
+    the caller.
+    """
+
+    # ~15k chars of English, but bounded in tokens so CJK or code-heavy
+    # samples can't blow past the plan model's cheap context
+    max_sample_tokens = 3500
+    sample = truncate_to_tokens(text, max_sample_tokens)
+
+    return (
+        _PROMPT_HEADER
+        + orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode()
+        + f'\n\nDocument sample (may be truncated):\n"""{sample}'
+        + _PROMPT_FIELDS
+    )
+
+
+# Returned for empty input without spending the LLM round-trip; there
+# is no sample to tailor a plan to, so the example defaults are as good
+# as anything the model would produce.
+DEFAULT_PLAN: Dict[str, Any] = {
+    "window_size": 200,
+    "overlap": 40,
+    "mode": "tokens",
+    "break_on_headings": True,
+    "max_chunks": None,
+    "notes": "Default plan: no document sample provided.",
+}
+
+
 def ask_llm_for_plan(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Call an LLM to obtain a ChunkingPlan as a JSON object."""
 
+    if not text.strip():
+        return dict(DEFAULT_PLAN)
+
     prompt = build_chunking_prompt(text, metadata)
 
     client = get_openai_plan_client()
@@ -0,0 +1,40 @@
+"""Token-aware truncation for prompt building.
+
+We only need to bound the document sample fed to the plan model. If
+`tiktoken` is available we slice on the token array; otherwise we fall
+back to a simple heuristic of ~4 characters per token.
+"""
+from __future__ import annotations
+
+import functools
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:  # pragma: no cover - depends on installed extras
+    tiktoken = None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str):
+    """Memoized encoder lookup; loading the BPE tables is expensive."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, encoding_name: str = "cl100k_base") -> str:
+    """Truncate text to at most max_tokens, slicing on the token array.
+
+    Character slicing misjudges code-heavy or non-English text, where
+    the char/token ratio varies widely; slicing the encoded ids keeps
+    the result predictable in tokens regardless of language.
+    """
+    if tiktoken is not None:
+        try:
+            enc = _get_encoding(encoding_name)
+            ids = enc.encode_ordinary(text)
+            if len(ids) <= max_tokens:
+                return text
+            return enc.decode(ids[:max_tokens])
+        except Exception:
+            pass
+    # Heuristic: average 4 characters per token for English-ish text.
+    return text[: max(1, max_tokens * 4)]
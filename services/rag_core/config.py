@@ -39,6 +39,7 @@ Usage:
 """
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass
 from functools import lru_cache
@@ -58,6 +59,10 @@ from .models import (
 )
 
 
+# LibYAML's C loader parses several times faster than the pure-Python
+# SafeLoader; fall back when PyYAML was built without the bindings.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Config search paths in priority order
 CONFIG_SEARCH_PATHS = [
     Path("./rag-config.yaml"),
@@ -80,15 +85,20 @@ class RerankSettings:
     base_url: Optional[str]
 
 
+@lru_cache(maxsize=1)
 def _find_config_file() -> Optional[Path]:
     """Find the configuration file using search order.
 
+    Memoized: the search stats up to five paths, and the result cannot
+    change unless the filesystem or RAG_CONFIG_PATH does. Call
+    _find_config_file.cache_clear() alongside load_config.cache_clear()
+    to re-probe.
+
     Returns:
         Path to config file if found, None otherwise.
     """
     # Check explicit path first
-    explicit_path = os.environ.get("RAG_CONFIG_PATH")
-    if explicit_path:
+    if explicit_path := os.environ.get("RAG_CONFIG_PATH"):
         path = Path(explicit_path)
         if path.exists():
             return path
@@ -117,11 +127,72 @@ def _load_yaml_config(path: Path) -> dict:
     """
     try:
         with open(path, "r") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse config file {path}: {e}") from e
 
 
+def _load_raw_config(path: Path) -> dict:
+    """Load the raw config dict, preferring a pre-parsed JSON sibling.
+
+    JSON parses far faster than YAML, so after a successful YAML parse a
+    `<name>.yaml.json` cache is written next to the file and reused by
+    later process starts while its mtime is at least the YAML's. All
+    cache I/O is best-effort: read-only config mounts (ConfigMaps) and
+    stale or corrupt caches just fall back to the YAML parse.
+
+    Args:
+        path: Path to YAML file.
+
+    Returns:
+        Parsed configuration dict.
+    """
+    cache_path = path.with_suffix(".yaml.json")
+    try:
+        if cache_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            with open(cache_path, "r") as f:
+                return json.load(f) or {}
+    except (OSError, ValueError):
+        pass
+
+    raw = _load_yaml_config(path)
+    try:
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(raw, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return raw
+
+
+# Parsed+validated configs keyed by (path, mtime_ns, size): survives
+# load_config.cache_clear() so an unchanged file skips the YAML parse
+# and pydantic validation on reload.
+_CONFIG_CACHE: dict[tuple[Path, int, int], RagConfig] = {}
+
+
+def _load_validated_config(path: Path) -> RagConfig:
+    """Parse and validate the config file, reusing unchanged content.
+
+    Args:
+        path: Path to YAML file.
+
+    Returns:
+        Validated RagConfig for the file's current content.
+    """
+    st = path.stat()
+    key = (path, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        # Single config file per process; drop entries for older content
+        _CONFIG_CACHE.clear()
+        cached = RagConfig.model_validate(_load_raw_config(path))
+        _CONFIG_CACHE[key] = cached
+    # Copy so env overrides never mutate the cached baseline
+    return cached.model_copy(deep=True)
+
+
 def _build_config_from_env() -> RagConfig:
     """Build configuration from environment variables only.
 
@@ -131,12 +202,15 @@ def _build_config_from_env() -> RagConfig:
     Returns:
         RagConfig built from environment variables.
     """
+    env = os.environ
+
     # Build embedding config from env vars
-    embed_model = os.environ.get(
-        "EMBEDDING_MODEL",
-        os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+    embed_model = (
+        env.get("EMBEDDING_MODEL")
+        or env.get("OPENAI_EMBEDDING_MODEL")
+        or "text-embedding-3-small"
     )
-    embed_base_url = os.environ.get("EMBEDDING_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
+    embed_base_url = env.get("EMBEDDING_BASE_URL") or env.get("OPENAI_BASE_URL")
 
     embedding_providers = {
         "openai": EmbeddingProviderConfig(
@@ -148,7 +222,7 @@ def _build_config_from_env() -> RagConfig:
     }
 
     # Build rerank config from env vars
-    rerank_provider = os.environ.get("RERANK_PROVIDER", "none").lower()
+    rerank_provider = env.get("RERANK_PROVIDER", "none").lower()
     if rerank_provider in {"", "none"}:
         rerank_provider = "none"
 
@@ -160,12 +234,12 @@ def _build_config_from_env() -> RagConfig:
     }
 
     if rerank_provider == "cohere":
-        default_model = "rerank-english-v3.0"
-        rerank_model = os.environ.get(
-            "RERANK_MODEL",
-            os.environ.get("OPENAI_RERANK_MODEL", default_model)
+        rerank_model = (
+            env.get("RERANK_MODEL")
+            or env.get("OPENAI_RERANK_MODEL")
+            or "rerank-english-v3.0"
         )
-        rerank_base_url = os.environ.get("RERANK_BASE_URL")
+        rerank_base_url = env.get("RERANK_BASE_URL")
         rerank_providers["cohere"] = RerankProviderConfig(
             type="cohere",
             base_url=rerank_base_url,
@@ -174,12 +248,12 @@ def _build_config_from_env() -> RagConfig:
         )
     elif rerank_provider not in {"", "none"}:
         # Generic provider from env
-        default_model = "gpt-4.1-mini"
-        rerank_model = os.environ.get(
-            "RERANK_MODEL",
-            os.environ.get("OPENAI_RERANK_MODEL", default_model)
+        rerank_model = (
+            env.get("RERANK_MODEL")
+            or env.get("OPENAI_RERANK_MODEL")
+            or "gpt-4.1-mini"
         )
-        rerank_base_url = os.environ.get("RERANK_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
+        rerank_base_url = env.get("RERANK_BASE_URL") or env.get("OPENAI_BASE_URL")
         rerank_providers[rerank_provider] = RerankProviderConfig(
             type="openai-compatible",
             base_url=rerank_base_url,
@@ -189,8 +263,8 @@ def _build_config_from_env() -> RagConfig:
 
     # Build services config
     services = ServicesConfig(
-        embedding_service_url=os.environ.get("EMBEDDING_SERVICE_URL"),
-        rerank_service_url=os.environ.get("RERANK_SERVICE_URL"),
+        embedding_service_url=env.get("EMBEDDING_SERVICE_URL"),
+        rerank_service_url=env.get("RERANK_SERVICE_URL"),
     )
 
     return RagConfig(
@@ -218,18 +292,20 @@ def _apply_env_overrides(config: RagConfig) -> RagConfig:
     Returns:
         Configuration with env overrides applied.
     """
+    env = os.environ
+
     # Override active providers
-    if embed_provider := os.environ.get("RAG_EMBEDDING_PROVIDER"):
+    if embed_provider := env.get("RAG_EMBEDDING_PROVIDER"):
         config.embedding.active = embed_provider
 
-    if rerank_provider := os.environ.get("RAG_RERANK_PROVIDER"):
+    if rerank_provider := env.get("RAG_RERANK_PROVIDER"):
         config.rerank.active = rerank_provider
 
     # Override service URLs
-    if embed_url := os.environ.get("EMBEDDING_SERVICE_URL"):
+    if embed_url := env.get("EMBEDDING_SERVICE_URL"):
         config.services.embedding_service_url = embed_url
 
-    if rerank_url := os.environ.get("RERANK_SERVICE_URL"):
+    if rerank_url := env.get("RERANK_SERVICE_URL"):
         config.services.rerank_service_url = rerank_url
 
     return config
@@ -247,13 +323,13 @@ def load_config() -> RagConfig:
 
     Note:
         Configuration is cached after first load. Use load_config.cache_clear()
-        to force reload.
+        to force reload; add _find_config_file.cache_clear() if the file may
+        have moved.
     """
     config_path = _find_config_file()
 
     if config_path:
-        raw_config = _load_yaml_config(config_path)
-        config = RagConfig.model_validate(raw_config)
+        config = _load_validated_config(config_path)
     else:
         config = _build_config_from_env()
 
@@ -275,11 +351,13 @@ def get_embedding_config() -> EmbeddingProviderConfig:
     if active not in config.embedding.providers:
         # Build default provider from env if not in config
         if active == "openai":
-            embed_model = os.environ.get(
-                "EMBEDDING_MODEL",
-                os.environ.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+            env = os.environ
+            embed_model = (
+                env.get("EMBEDDING_MODEL")
+                or env.get("OPENAI_EMBEDDING_MODEL")
+                or "text-embedding-3-small"
             )
-            embed_base_url = os.environ.get("EMBEDDING_BASE_URL") or os.environ.get("OPENAI_BASE_URL")
+            embed_base_url = env.get("EMBEDDING_BASE_URL") or env.get("OPENAI_BASE_URL")
             return EmbeddingProviderConfig(
                 type="openai-compatible",
                 base_url=embed_base_url,
@@ -307,13 +385,15 @@ def get_rerank_config() -> Optional[RerankProviderConfig]:
     if active not in config.rerank.providers:
         # Build default provider from env if not in config
         if active == "cohere":
-            rerank_model = os.environ.get(
-                "RERANK_MODEL",
-                os.environ.get("OPENAI_RERANK_MODEL", "rerank-english-v3.0")
+            env = os.environ
+            rerank_model = (
+                env.get("RERANK_MODEL")
+                or env.get("OPENAI_RERANK_MODEL")
+                or "rerank-english-v3.0"
             )
             return RerankProviderConfig(
                 type="cohere",
-                base_url=os.environ.get("RERANK_BASE_URL"),
+                base_url=env.get("RERANK_BASE_URL"),
                 api_key_env="COHERE_API_KEY",
                 model=rerank_model,
             )
@@ -331,30 +411,33 @@ def _resolve_api_key(provider_config: EmbeddingProviderConfig | RerankProviderCo
     Returns:
         API key value from environment, or None if not found.
     """
-    if not provider_config.api_key_env:
+    key_env = provider_config.api_key_env
+    if not key_env:
         return None
 
+    env = os.environ
+
     # Check the specified env var first
-    api_key = os.environ.get(provider_config.api_key_env)
-    if api_key:
+    if api_key := env.get(key_env):
         return api_key
 
     # Fallback chain for common cases
-    if provider_config.api_key_env in ("EMBEDDING_API_KEY",):
-        api_key = os.environ.get("OPENAI_API_KEY")
-
-    if provider_config.api_key_env in ("RERANK_API_KEY",):
-        api_key = os.environ.get("OPENAI_API_KEY")
-
-    if provider_config.api_key_env in ("COHERE_API_KEY",):
-        api_key = os.environ.get("RERANK_API_KEY")
+    if key_env in ("EMBEDDING_API_KEY", "RERANK_API_KEY"):
+        return env.get("OPENAI_API_KEY")
+    if key_env == "COHERE_API_KEY":
+        return env.get("RERANK_API_KEY")
 
-    return api_key
+    return None
 
 
+@lru_cache(maxsize=8)
 def _build_openai_client(api_key: str, base_url: Optional[str]) -> OpenAI:
     """Build an OpenAI client with given credentials.
 
+    Memoized on (api_key, base_url): the client owns an httpx pool, so
+    reusing it keeps connections warm instead of paying TLS setup on
+    every get_embedding_client()/get_rerank_client() call.
+
     Args:
         api_key: API key for authentication.
         base_url: Optional base URL for API endpoint.
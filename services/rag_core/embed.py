@@ -22,9 +22,12 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from .config import get_embedding_client, get_embedding_config, get_service_url
 from .token_utils import estimate_tokens
@@ -35,6 +38,36 @@ logger = logging.getLogger(__name__)
 _provider_cache: dict = {}
 
 
+def _build_service_session() -> requests.Session:
+    """Build the pooled session for embedding-service calls.
+
+    A bare requests.post opens a fresh TCP+TLS connection per call; the
+    session keeps connections alive across calls and retries transient
+    gateway errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_service_session()
+
+
+@lru_cache(maxsize=4)
+def _service_headers(token: Optional[str]) -> dict[str, str]:
+    """Request headers for the embedding service, cached per token."""
+    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
 def _get_embedding_provider():
     """Get the configured embedding provider instance.
 
@@ -96,10 +129,8 @@ def _embed_via_service(
         return None
 
     # Build request headers
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
     token = os.environ.get("EMBEDDING_SERVICE_TOKEN") or os.environ.get("SERVICE_AUTH_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    headers = _service_headers(token)
 
     # Build payload
     payload: dict[str, object] = {"texts": texts}
@@ -110,7 +141,7 @@ def _embed_via_service(
 
     try:
         endpoint = service_url.rstrip("/") + "/embed"
-        resp = requests.post(endpoint, json=payload, headers=headers, timeout=timeout)
+        resp = _SESSION.post(endpoint, json=payload, headers=headers, timeout=timeout)
         resp.raise_for_status()
         data = resp.json()
         vectors = data.get("vectors")
@@ -145,13 +176,15 @@ def _embed_batch_direct(
         List of embedding vectors.
     """
     client = get_embedding_client()
-    vectors: List[List[float]] = []
+    batches: List[List[str]] = []
     batch: List[str] = []
     current_tokens = 0
 
-    for text in texts:
-        est = estimate_tokens(text)
+    # Estimate all texts in one pre-pass; the packing loop below then
+    # works over precomputed ints instead of re-dispatching per element
+    estimates = [estimate_tokens(text) for text in texts]
 
+    for text, est in zip(texts, estimates):
         # Truncate if single text exceeds limit
         if est > max_input_tokens:
             keep_ratio = max_input_tokens / est
@@ -161,25 +194,35 @@ def _embed_batch_direct(
 
         # Flush batch if adding this text would exceed limit
         if batch and current_tokens + est > max_tokens_per_batch:
-            kwargs: dict[str, object] = {"model": model, "input": batch}
-            if encoding_format:
-                kwargs["encoding_format"] = encoding_format
-
-            response = client.embeddings.create(**kwargs)
-            vectors.extend([item.embedding for item in response.data])
+            batches.append(batch)
             batch = []
             current_tokens = 0
 
         batch.append(text)
         current_tokens += est
 
-    # Embed remaining batch
     if batch:
-        kwargs = {"model": model, "input": batch}
+        batches.append(batch)
+
+    def _create(b: List[str]):
+        kwargs: dict[str, object] = {"model": model, "input": b}
         if encoding_format:
             kwargs["encoding_format"] = encoding_format
+        return client.embeddings.create(**kwargs)
+
+    # The path is network-bound, so overlap the API round-trips instead
+    # of letting each one block the next. EMBED_CONCURRENCY caps the
+    # in-flight calls to respect upstream rate limits; pool.map keeps
+    # responses in batch order.
+    if len(batches) <= 1:
+        responses = [_create(b) for b in batches]
+    else:
+        concurrency = int(os.environ.get("EMBED_CONCURRENCY", "4"))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+            responses = list(pool.map(_create, batches))
 
-        response = client.embeddings.create(**kwargs)
+    vectors: List[List[float]] = []
+    for response in responses:
         vectors.extend([item.embedding for item in response.data])
 
     return vectors
@@ -14,7 +14,7 @@ from rag_core import rerank_documents, get_rerank_settings
 
 
 AUTH_TOKEN = os.environ.get("AUTH_TOKEN")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger("rerank_service")
 app = FastAPI(title="Rerank Service", version="0.1.0")
 
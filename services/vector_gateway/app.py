@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import json
 import logging
 import os
+import re
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Protocol
@@ -25,7 +27,7 @@ DEFAULT_COLLECTION = os.environ.get("MILVUS_COLLECTION", "rag_gateway")
 REQUIRE_BACKEND = os.environ.get("GATEWAY_REQUIRE_BACKEND", "0").lower() in {"1", "true", "yes"}
 CONFIG_PATH = os.environ.get("GATEWAY_CONFIG")
 RERANK_SERVICE_URL = os.environ.get("RERANK_SERVICE_URL", "http://rerank-service.advanced-rag.svc.cluster.local:8003")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger("vector_gateway")
 app = FastAPI(title="Vector Gateway", version="0.2.0")
 
@@ -204,6 +206,8 @@ class SearchRequest(BaseModel):
     collection: Optional[str] = Field(default=None, description="Collection to search (defaults to env MILVUS_COLLECTION)")
     top_k: int = Field(default=5, ge=1, le=100, description="Number of results to return")
     context_window: int = Field(default=0, ge=0, le=10, description="Number of surrounding chunks to include (0=disabled)")
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Drop hits scoring below this threshold (0=disabled)")
+    query_embedding: Optional[List[float]] = Field(default=None, description="Pre-computed query embedding; skips the embedding forward pass")
     filters: Optional[SearchFilters] = Field(default=None, description="Metadata filters")
     model: Optional[str] = Field(default=None, description="Embedding model override")
 
@@ -238,6 +242,28 @@ class SearchResponse(BaseModel):
     reranked: bool = False
 
 
+class BatchSearchRequest(BaseModel):
+    """Several queries against one collection with shared parameters."""
+    queries: List[str]
+    collection: Optional[str] = Field(default=None, description="Collection to search (defaults to env MILVUS_COLLECTION)")
+    top_k: int = Field(default=5, ge=1, le=100, description="Number of results per query")
+    context_window: int = Field(default=0, ge=0, le=10, description="Number of surrounding chunks to include (0=disabled)")
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Drop hits scoring below this threshold (0=disabled)")
+    filters: Optional[SearchFilters] = Field(default=None, description="Metadata filters shared by all queries")
+    model: Optional[str] = Field(default=None, description="Embedding model override")
+
+    @validator("queries")
+    def _validate_queries(cls, v: List[str]) -> List[str]:
+        if not v:
+            raise ValueError("queries must be non-empty")
+        return v
+
+
+class BatchSearchResponse(BaseModel):
+    """One SearchResponse per query, in request order."""
+    responses: List[SearchResponse]
+
+
 def _auth_dependency(authorization: str = Header(None), x_api_key: str = Header(None)) -> None:
     if not AUTH_TOKEN:
         return
@@ -387,25 +413,37 @@ def _rerank_documents(query: str, documents: List[str], top_k: Optional[int] = N
         return list(range(len(documents))), False
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compiled regex for a glob pattern, memoized per pattern string.
+
+    Agents reuse the same handful of patterns across searches; caching
+    the compiled form keeps the per-hit cost to a single regex match.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
 def _apply_filters(hits: List[Dict[str, Any]], filters: Optional[SearchFilters]) -> List[Dict[str, Any]]:
     """Apply metadata filters to search hits."""
     if not filters:
         return hits
 
+    # Compile the glob once per request, not once per hit
+    pattern = _compile_pattern(filters.file_pattern) if filters.file_pattern else None
+
     filtered = []
     for hit in hits:
+        # Hit metadata is built flat in search() (entity fields spread in)
         metadata = hit.get("metadata", {})
-        # The entity data may be nested under metadata.entity (from Milvus) or directly in metadata
-        entity = metadata.get("entity", metadata)
-        file_name = entity.get("file_name", "") or metadata.get("file_name", "")
-        mime_type = entity.get("mime_type", "") or metadata.get("mime_type", "")
+        file_name = metadata.get("file_name", "")
+        mime_type = metadata.get("mime_type", "")
 
         # file_name exact match
         if filters.file_name and file_name != filters.file_name:
             continue
 
         # file_pattern glob match
-        if filters.file_pattern and not fnmatch.fnmatch(file_name, filters.file_pattern):
+        if pattern is not None and not pattern.match(file_name):
             continue
 
         # mime_type exact match
@@ -439,6 +477,108 @@ def _get_surrounding_chunks(
         return []
 
 
+def _memory_search_one(
+    query: str, qvec: List[float], top_k: int, min_score: float
+) -> List[SearchHit]:
+    """One query against the memory backend."""
+    docs = BACKEND.search(qvec, query_text=query, top_k=top_k)
+    scored_hits: List[SearchHit] = []
+    for doc in docs:
+        score = _cosine_similarity(qvec, doc.vector) if doc.vector else doc.metadata.get("score", 0.0)
+        score = _normalize_score(score)
+        if score < min_score:
+            continue
+        scored_hits.append(SearchHit(
+            doc_id=doc.doc_id, text=doc.text, metadata=doc.metadata, score=score
+        ))
+    return scored_hits
+
+
+def _milvus_search_one(
+    collection: str,
+    query: str,
+    qvec: List[float],
+    top_k: int,
+    context_window: int,
+    min_score: float,
+    filters: Optional[SearchFilters],
+) -> tuple[List[SearchHit], bool]:
+    """One query through the full milvus pipeline.
+
+    Hybrid search, score threshold, metadata filters, rerank, and context
+    expansion; shared by /search and /batch_search. Returns (hits, reranked).
+    """
+    # Overfetch for filtering and reranking
+    overfetch = max(top_k * 4, 50) if filters else top_k * 2
+
+    # Hybrid search
+    results = milvus_io.hybrid_search(
+        collection=collection,
+        query_vector=qvec,
+        query_text=query,
+        top_k=overfetch,
+        overfetch=overfetch,
+        rrf_k=60,
+    )
+
+    # Convert to hit dicts
+    raw_hits: List[Dict[str, Any]] = []
+    for hit in results[0] if results else []:
+        entity = hit.get("entity", {}) if isinstance(hit, dict) else getattr(hit, "entity", {}) or {}
+        distance = hit.get("distance") if isinstance(hit, dict) else getattr(hit, "distance", None)
+        score = 1.0 - float(distance) if isinstance(distance, (int, float)) else 0.0
+        raw_hits.append({
+            "doc_id": str(entity.get("chunk_id", "")),
+            "text": entity.get("text", ""),
+            "score": _normalize_score(score),
+            "metadata": {**entity, "distance": distance, "score": _normalize_score(score)},
+        })
+
+    # Drop below-threshold hits server-side, before reranking, context
+    # expansion, and response serialization spend time on them
+    if min_score > 0.0:
+        raw_hits = [h for h in raw_hits if h["score"] >= min_score]
+
+    # Apply filters
+    filtered_hits = _apply_filters(raw_hits, filters)
+
+    # Rerank (always on, graceful fallback)
+    reranked = False
+    if filtered_hits:
+        texts = [h["text"] for h in filtered_hits]
+        rerank_indices, rerank_success = _rerank_documents(query, texts, top_k=top_k)
+        reranked = rerank_success
+        if rerank_success:
+            filtered_hits = [filtered_hits[i] for i in rerank_indices if i < len(filtered_hits)]
+
+    # Limit to top_k
+    filtered_hits = filtered_hits[:top_k]
+
+    # Build response with surrounding chunks
+    scored_hits: List[SearchHit] = []
+    for hit in filtered_hits:
+        surrounding = []
+        if context_window > 0:
+            # Hit metadata is built flat above (entity fields spread in)
+            metadata = hit["metadata"]
+            file_name = metadata.get("file_name", "")
+            chunk_index = metadata.get("chunk_index") or 0
+            if file_name:
+                surrounding = _get_surrounding_chunks(
+                    collection, file_name, chunk_index, context_window
+                )
+
+        scored_hits.append(SearchHit(
+            doc_id=hit["doc_id"],
+            text=hit["text"],
+            score=hit["score"],
+            metadata=hit["metadata"],
+            surrounding_chunks=surrounding,
+        ))
+
+    return scored_hits, reranked
+
+
 @app.post("/search", response_model=SearchResponse)
 def search(request: SearchRequest, _: None = Depends(_auth_dependency)) -> SearchResponse:
     start = time.time()
@@ -452,15 +592,8 @@ def search(request: SearchRequest, _: None = Depends(_auth_dependency)) -> Searc
                 hits=[], count=0, latency_ms=0, backend=BACKEND.name,
                 collection=collection, reranked=False
             )
-        qvec = embed_texts([request.query], model=request.model, prefer_service=True)[0]
-        docs = BACKEND.search(qvec, query_text=request.query, top_k=request.top_k)
-        scored_hits: List[SearchHit] = []
-        for doc in docs:
-            score = _cosine_similarity(qvec, doc.vector) if doc.vector else doc.metadata.get("score", 0.0)
-            score = _normalize_score(score)
-            scored_hits.append(SearchHit(
-                doc_id=doc.doc_id, text=doc.text, metadata=doc.metadata, score=score
-            ))
+        qvec = request.query_embedding or embed_texts([request.query], model=request.model, prefer_service=True)[0]
+        scored_hits = _memory_search_one(request.query, qvec, request.top_k, request.min_score)
         latency_ms = int((time.time() - start) * 1000)
         return SearchResponse(
             hits=scored_hits, count=len(scored_hits), latency_ms=latency_ms,
@@ -469,72 +602,14 @@ def search(request: SearchRequest, _: None = Depends(_auth_dependency)) -> Searc
 
     # Milvus backend - use enhanced search
     try:
-        # Embed the query
-        qvec = embed_texts([request.query], model=request.model, prefer_service=True)[0]
+        # Embed the query, unless the caller already did
+        qvec = request.query_embedding or embed_texts([request.query], model=request.model, prefer_service=True)[0]
 
-        # Overfetch for filtering and reranking
-        overfetch = max(request.top_k * 4, 50) if request.filters else request.top_k * 2
-
-        # Hybrid search
-        results = milvus_io.hybrid_search(
-            collection=collection,
-            query_vector=qvec,
-            query_text=request.query,
-            top_k=overfetch,
-            overfetch=overfetch,
-            rrf_k=60,
+        scored_hits, reranked = _milvus_search_one(
+            collection, request.query, qvec, request.top_k,
+            request.context_window, request.min_score, request.filters,
         )
 
-        # Convert to hit dicts
-        raw_hits: List[Dict[str, Any]] = []
-        for hit in results[0] if results else []:
-            entity = hit.get("entity", {}) if isinstance(hit, dict) else getattr(hit, "entity", {}) or {}
-            distance = hit.get("distance") if isinstance(hit, dict) else getattr(hit, "distance", None)
-            score = 1.0 - float(distance) if isinstance(distance, (int, float)) else 0.0
-            raw_hits.append({
-                "doc_id": str(entity.get("chunk_id", "")),
-                "text": entity.get("text", ""),
-                "score": _normalize_score(score),
-                "metadata": {**entity, "distance": distance, "score": _normalize_score(score)},
-            })
-
-        # Apply filters
-        filtered_hits = _apply_filters(raw_hits, request.filters)
-
-        # Rerank (always on, graceful fallback)
-        reranked = False
-        if filtered_hits:
-            texts = [h["text"] for h in filtered_hits]
-            rerank_indices, rerank_success = _rerank_documents(request.query, texts, top_k=request.top_k)
-            reranked = rerank_success
-            if rerank_success:
-                filtered_hits = [filtered_hits[i] for i in rerank_indices if i < len(filtered_hits)]
-
-        # Limit to top_k
-        filtered_hits = filtered_hits[:request.top_k]
-
-        # Build response with surrounding chunks
-        scored_hits: List[SearchHit] = []
-        for hit in filtered_hits:
-            surrounding = []
-            if request.context_window > 0:
-                metadata = hit["metadata"]
-                entity = metadata.get("entity", metadata)
-                file_name = entity.get("file_name", "") or metadata.get("file_name", "")
-                chunk_index = entity.get("chunk_index", 0) if entity.get("chunk_index") is not None else metadata.get("chunk_index", 0)
-                if file_name:
-                    surrounding = _get_surrounding_chunks(
-                        collection, file_name, chunk_index, request.context_window
-                    )
-
-            scored_hits.append(SearchHit(
-                doc_id=hit["doc_id"],
-                text=hit["text"],
-                score=hit["score"],
-                metadata=hit["metadata"],
-                surrounding_chunks=surrounding,
-            ))
-
         latency_ms = int((time.time() - start) * 1000)
         logger.info(
             "search collection=%s query=%r top_k=%d filters=%s context_window=%d reranked=%s hits=%d latency_ms=%d",
@@ -556,6 +631,58 @@ def search(request: SearchRequest, _: None = Depends(_auth_dependency)) -> Searc
         raise HTTPException(status_code=500, detail=f"Search failed: {exc}")
 
 
+@app.post("/batch_search", response_model=BatchSearchResponse)
+def batch_search(request: BatchSearchRequest, _: None = Depends(_auth_dependency)) -> BatchSearchResponse:
+    """Run several queries against one collection in a single RPC.
+
+    Queries share one embedding forward pass (embed_texts batches them)
+    and the fixed per-request overhead; each still runs the full search
+    pipeline and gets its own SearchResponse, in request order.
+    """
+    start = time.time()
+    collection = request.collection or DEFAULT_COLLECTION
+
+    # One batched forward pass for all queries
+    qvecs = embed_texts(request.queries, model=request.model, prefer_service=True)
+    if len(qvecs) != len(request.queries):
+        raise HTTPException(status_code=500, detail="embedding failed")
+
+    if BACKEND.name != "milvus":
+        responses = []
+        for query, qvec in zip(request.queries, qvecs):
+            scored_hits = _memory_search_one(query, qvec, request.top_k, request.min_score) if BACKEND.count() else []
+            responses.append(SearchResponse(
+                hits=scored_hits, count=len(scored_hits),
+                latency_ms=int((time.time() - start) * 1000),
+                backend=BACKEND.name, collection=collection, reranked=False,
+            ))
+        return BatchSearchResponse(responses=responses)
+
+    try:
+        responses = []
+        for query, qvec in zip(request.queries, qvecs):
+            scored_hits, reranked = _milvus_search_one(
+                collection, query, qvec, request.top_k,
+                request.context_window, request.min_score, request.filters,
+            )
+            responses.append(SearchResponse(
+                hits=scored_hits, count=len(scored_hits),
+                latency_ms=int((time.time() - start) * 1000),
+                backend="milvus", collection=collection, reranked=reranked,
+            ))
+
+        logger.info(
+            "batch_search collection=%s queries=%d top_k=%d latency_ms=%d",
+            collection, len(request.queries), request.top_k,
+            int((time.time() - start) * 1000),
+        )
+        return BatchSearchResponse(responses=responses)
+
+    except Exception as exc:
+        logger.error("batch_search failed: %s", exc)
+        raise HTTPException(status_code=500, detail=f"Batch search failed: {exc}")
+
+
 # ============================================================================
 # Collection Discovery Endpoints
 # ============================================================================
@@ -572,6 +699,8 @@ class CollectionStats(BaseModel):
     row_count: int
     file_names: List[str]
     mime_types: List[str]
+    # Untrimmed count; file_names may be capped by the limit query param
+    total_file_names: int = 0
 
 
 class CollectionsResponse(BaseModel):
@@ -585,6 +714,12 @@ class CollectionStatsResponse(BaseModel):
     stats: CollectionStats
 
 
+class SourcesResponse(BaseModel):
+    """Response for GET /collections/{name}/sources."""
+    file_names: List[str]
+    count: int
+
+
 @app.get("/collections", response_model=CollectionsResponse)
 def list_collections(_: None = Depends(_auth_dependency)) -> CollectionsResponse:
     """List all available Milvus collections."""
@@ -602,9 +737,19 @@ def list_collections(_: None = Depends(_auth_dependency)) -> CollectionsResponse
 
 @app.get("/collections/{collection_name}/stats", response_model=CollectionStatsResponse)
 def get_collection_stats(
-    collection_name: str, _: None = Depends(_auth_dependency)
+    collection_name: str,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+    _: None = Depends(_auth_dependency),
 ) -> CollectionStatsResponse:
-    """Get statistics for a specific collection."""
+    """Get statistics for a specific collection.
+
+    Large collections can carry thousands of file names; `limit` caps
+    the file_names list server-side so the full payload never ships,
+    with total_file_names always reporting the untrimmed count.
+    `fields` is a comma-separated subset of {file_names, mime_types} to
+    include; name, row_count, and total_file_names are always present.
+    """
     if BACKEND.name != "milvus":
         raise HTTPException(status_code=400, detail="Stats only available for Milvus backend")
 
@@ -613,16 +758,30 @@ def get_collection_stats(
         if "error" in stats:
             raise HTTPException(status_code=404, detail=stats["error"])
 
+        file_names = stats.get("file_names", [])
+        mime_types = stats.get("mime_types", [])
+        total_file_names = len(file_names)
+
+        if fields:
+            wanted = {f.strip() for f in fields.split(",") if f.strip()}
+            if "file_names" not in wanted:
+                file_names = []
+            if "mime_types" not in wanted:
+                mime_types = []
+        if limit is not None and limit >= 0:
+            file_names = file_names[:limit]
+
         logger.info(
-            "get_collection_stats collection=%s rows=%d files=%d",
-            collection_name, stats.get("row_count", 0), len(stats.get("file_names", []))
+            "get_collection_stats collection=%s rows=%d files=%d returned=%d",
+            collection_name, stats.get("row_count", 0), total_file_names, len(file_names)
         )
         return CollectionStatsResponse(
             stats=CollectionStats(
                 name=stats["name"],
                 row_count=stats.get("row_count", 0),
-                file_names=stats.get("file_names", []),
-                mime_types=stats.get("mime_types", []),
+                file_names=file_names,
+                mime_types=mime_types,
+                total_file_names=total_file_names,
             )
         )
     except HTTPException:
@@ -632,6 +791,31 @@ def get_collection_stats(
         raise HTTPException(status_code=500, detail=f"Failed to get collection stats: {exc}")
 
 
+@app.get("/collections/{collection_name}/sources", response_model=SourcesResponse)
+def list_collection_sources(
+    collection_name: str, limit: int = 50, _: None = Depends(_auth_dependency)
+) -> SourcesResponse:
+    """List source file names for a collection without full stats aggregation."""
+    if BACKEND.name != "milvus":
+        raise HTTPException(status_code=400, detail="Sources only available for Milvus backend")
+
+    try:
+        result = milvus_io.list_source_files(collection_name, limit=limit)
+        if "error" in result:
+            raise HTTPException(status_code=404, detail=result["error"])
+
+        file_names = result.get("file_names", [])
+        logger.info(
+            "list_collection_sources collection=%s files=%d", collection_name, len(file_names)
+        )
+        return SourcesResponse(file_names=file_names, count=len(file_names))
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.error("list_collection_sources failed: %s", exc)
+        raise HTTPException(status_code=500, detail=f"Failed to list sources: {exc}")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -352,6 +352,29 @@ def get_or_create_collection(name: str, dim: int = 1536) -> Dict[str, Any]:
     return {"client": client, "collection": name}
 
 
+def list_source_files(collection: str, limit: int = 50) -> Dict[str, Any]:
+    """List distinct source file names for a collection.
+
+    Cheaper than get_collection_stats: skips the row count and only
+    pulls the file_name field.
+    """
+    client = get_client()
+    if not client.has_collection(collection):
+        return {"error": f"Collection {collection} not found"}
+
+    client.load_collection(collection)
+    # Sample more rows than requested files since each file spans many chunks
+    rows = client.query(
+        collection_name=collection,
+        filter="",
+        output_fields=["file_name"],
+        limit=min(max(limit * 4, 100), 1000),
+    )
+
+    file_names = sorted({r["file_name"] for r in rows if r.get("file_name")})
+    return {"name": collection, "file_names": file_names[:limit]}
+
+
 def get_collection_stats(collection: str) -> Dict[str, Any]:
     """Get statistics for a collection."""
     client = get_client()